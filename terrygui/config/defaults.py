@@ -18,6 +18,8 @@ DEFAULT_SETTINGS = {
     
     # Terraform binary
     "terraform_binary": "terraform",
+    # Last `terraform version` result: {"path", "mtime", "version"}
+    "terraform_probe_cache": None,
     
     # UI preferences
     "default_debug_output": False,
@@ -6,6 +6,8 @@ Handles loading, saving, and accessing application configuration.
 
 import json
 import os
+import stat
+import tempfile
 from pathlib import Path
 from typing import Any, Dict, Optional
 import logging
@@ -32,6 +34,7 @@ class Settings:
         self.config_dir = self._get_config_dir()
         self.config_file = self.config_dir / "settings.json"
         self._settings: Dict[str, Any] = {}
+        self._dirty = False
         self.load()
     
     @staticmethod
@@ -60,6 +63,8 @@ class Settings:
         
         If file doesn't exist or is invalid, uses default settings.
         """
+        self._dirty = False
+
         if not self.config_file.exists():
             logger.info("No config file found, using defaults")
             self._settings = DEFAULT_SETTINGS.copy()
@@ -83,19 +88,60 @@ class Settings:
         """
         Save current settings to file.
         
-        Creates parent directories if needed.
+        Creates parent directories if needed. The file is written to a
+        temporary sibling and renamed over the original, so an interrupted
+        save never leaves a truncated settings.json behind. An existing
+        file keeps its permission bits; a new one is created private (0600).
+        A symlinked settings.json is saved through the link, which is kept.
         """
+        # Serialize first: a failure here must not touch the existing file
+        data = json.dumps(self._settings, indent=2)
+        
         try:
             self.config_dir.mkdir(parents=True, exist_ok=True)
             
-            with open(self.config_file, 'w') as f:
-                json.dump(self._settings, f, indent=2)
+            # Replace the file a symlink points at (e.g. in a dotfiles
+            # repo), not the link itself
+            target = self.config_file.resolve()
+            fd, tmp_path = tempfile.mkstemp(
+                dir=target.parent, prefix=".settings-", suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    f.write(data)
+                # mkstemp creates the file 0600; carry over the mode the
+                # user's settings.json already has
+                try:
+                    mode = stat.S_IMODE(os.stat(target).st_mode)
+                except FileNotFoundError:
+                    pass
+                else:
+                    os.chmod(tmp_path, mode)
+                os.replace(tmp_path, target)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
             
+            self._dirty = False
             logger.info(f"Saved settings to {self.config_file}")
         
         except IOError as e:
             logger.error(f"Failed to save settings: {e}")
     
+    def flush(self):
+        """
+        Save settings only if they changed since the last load/save.
+        
+        Lets callers defer persistence without paying for a write when
+        nothing was modified in the meantime.
+        """
+        if self._dirty:
+            self.save()
+    
+    def is_dirty(self) -> bool:
+        """Return True if there are unsaved changes."""
+        return self._dirty
+    
     def get(self, key: str, default: Any = None) -> Any:
         """
         Get setting value.
@@ -141,6 +187,7 @@ class Settings:
         
         # Set the value
         target[keys[-1]] = value
+        self._dirty = True
     
     def add_recent_project(self, project_path: str):
         """
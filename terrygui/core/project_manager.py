@@ -213,6 +213,17 @@ class ProjectManager:
         
         self._state["variables"][var_name] = value
     
+    def set_variables_bulk(self, values: Dict[str, Any]):
+        """
+        Set several non-sensitive variable values at once.
+        
+        Sensitive variables must not be included (security policy).
+        
+        Args:
+            values: Mapping of variable name to value
+        """
+        self._state.setdefault("variables", {}).update(values)
+    
     def get_ui_state(self, key: str, default: Any = None) -> Any:
         """
         Get UI state value.
@@ -73,25 +73,31 @@ class TerraformParser:
         """
         self.project_path = project_path
         self._variables: Optional[List[TerraformVariable]] = None
+        self._variables_signature: Optional[Tuple] = None
         self._outputs: Optional[List[dict]] = None
     
     def parse_variables(self) -> List[TerraformVariable]:
         """
         Parse all .tf files in project for variable blocks.
         
+        The result is cached and only re-parsed when the set of .tf files,
+        or the mtime/size of any of them, changes.
+        
         Returns:
             List of TerraformVariable objects
             
         Raises:
             IOError: If unable to read files
         """
-        if self._variables is not None:
+        # Find all .tf files in project directory
+        tf_files = glob.glob(os.path.join(self.project_path, "*.tf"))
+        signature = self._files_signature(tf_files)
+        
+        if self._variables is not None and signature == self._variables_signature:
             return self._variables
         
         variables = []
-        
-        # Find all .tf files in project directory
-        tf_files = glob.glob(os.path.join(self.project_path, "*.tf"))
+        self._variables_signature = signature
         
         if not tf_files:
             logger.warning(f"No .tf files found in {self.project_path}")
@@ -112,6 +118,26 @@ class TerraformParser:
         
         return self._variables
     
+    @staticmethod
+    def _files_signature(tf_files: List[str]) -> Tuple:
+        """
+        Build a cheap change-detection key for a set of files.
+        
+        Args:
+            tf_files: Paths to .tf files
+            
+        Returns:
+            Sorted tuple of (path, mtime_ns, size) for each readable file
+        """
+        signature = []
+        for tf_file in sorted(tf_files):
+            try:
+                st = os.stat(tf_file)
+            except OSError:
+                continue
+            signature.append((tf_file, st.st_mtime_ns, st.st_size))
+        return tuple(signature)
+    
     def _parse_file_variables(self, tf_file: str) -> List[TerraformVariable]:
         """
         Parse variables from a single .tf file.
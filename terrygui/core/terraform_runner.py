@@ -233,6 +233,8 @@ class TerraformRunner:
         except subprocess.TimeoutExpired:
             if self._process is not None:
                 self._process.terminate()
+            if output_callback:
+                output_callback("Command timed out")
             return CommandResult(
                 exit_code=-1,
                 stdout="\n".join(stdout_lines),
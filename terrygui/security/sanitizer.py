@@ -7,8 +7,10 @@ This module provides secure input validation to prevent:
 - Invalid Terraform variable names/values
 """
 
+import functools
 import os
 import re
+import stat
 import json
 from pathlib import Path
 from typing import Any, Optional
@@ -30,6 +32,9 @@ class InputSanitizer:
     # can contain letters, digits, underscores, hyphens
     VARIABLE_NAME_PATTERN = re.compile(r'^[a-zA-Z_][a-zA-Z0-9_-]*$')
     
+    # Workspace name pattern: letters, digits, underscores, hyphens
+    WORKSPACE_NAME_PATTERN = re.compile(r'^[a-zA-Z0-9_-]+$')
+    
     # Maximum lengths to prevent resource exhaustion
     MAX_VARIABLE_NAME_LENGTH = 255
     MAX_VARIABLE_VALUE_LENGTH = 4096  # Increased for complex values
@@ -69,12 +74,14 @@ class InputSanitizer:
         except (OSError, ValueError) as e:
             raise SecurityError(f"Invalid path: {e}")
         
-        # Check if path exists
-        if not os.path.exists(abs_path):
+        # Check if path exists (one stat serves both checks)
+        try:
+            st = os.stat(abs_path)
+        except (OSError, ValueError):
             raise SecurityError(f"Path does not exist: {path}")
         
         # Must be a directory
-        if not os.path.isdir(abs_path):
+        if not stat.S_ISDIR(st.st_mode):
             raise SecurityError(f"Path is not a directory: {path}")
         
         # Check if within allowed directories
@@ -93,10 +100,13 @@ class InputSanitizer:
         return abs_path
     
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def sanitize_variable_name(name: str) -> str:
         """
         Validate Terraform variable name.
         
+        Accepted names are cached; rejected ones raise and are re-checked.
+        
         Rules:
         - Must start with letter or underscore
         - Can contain letters, digits, underscores, hyphens
@@ -194,10 +204,13 @@ class InputSanitizer:
             return str_value
     
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def sanitize_workspace_name(name: str) -> str:
         """
         Validate Terraform workspace name.
         
+        Accepted names are cached; rejected ones raise and are re-checked.
+        
         Rules:
         - Alphanumeric, hyphens, underscores only
         - Max length: 90 characters (Terraform limit)
@@ -224,7 +237,7 @@ class InputSanitizer:
         if name.startswith("-"):
             raise SecurityError("Workspace name cannot start with hyphen")
         
-        if not re.match(r'^[a-zA-Z0-9_-]+$', name):
+        if not InputSanitizer.WORKSPACE_NAME_PATTERN.match(name):
             raise SecurityError(
                 f"Invalid workspace name '{name}': only alphanumeric, hyphens, "
                 "underscores allowed"
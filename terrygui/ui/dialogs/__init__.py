@@ -1,7 +1,15 @@
 """Dialog windows for TerryGUI."""
 
+from ...utils._lazy import make_lazy_getattr
 from .confirm_dialog import ConfirmDialog
-from .workspace_dialog import WorkspaceDialog
-from .settings_dialog import SettingsDialog
+
+# Dialogs opened from menus are imported on first attribute access.
+_LAZY = {
+    "WorkspaceDialog": ".workspace_dialog",
+    "SettingsDialog": ".settings_dialog",
+}
+
+__getattr__ = make_lazy_getattr(__name__, _LAZY)
+
 
 __all__ = ["ConfirmDialog", "WorkspaceDialog", "SettingsDialog"]
@@ -6,6 +6,8 @@ MainWindow is a thin tab host.  Per-project logic lives in ProjectPane.
 
 import os
 import logging
+import threading
+from functools import partial
 from typing import Optional
 
 from PySide6.QtWidgets import (
@@ -17,13 +19,18 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt, QTimer, Signal
 from PySide6.QtGui import QAction
 
+from .. import __version__
 from ..config import Settings
 from ..utils import validate_terraform_installed
+from ..utils.validators import probe_terraform_from_settings, remember_terraform_probe
 
 from .widgets.project_pane import ProjectPane
 
 logger = logging.getLogger(__name__)
 
+# Starting directory for file dialogs, resolved once
+_HOME_DIR = os.path.expanduser("~")
+
 
 # ---------------------------------------------------------------------------
 # Custom tab bar: natural-width tabs with scroll-arrow support
@@ -102,11 +109,15 @@ class _AppTabBar(QTabBar):
 class MainWindow(QMainWindow):
     """Main application window — hosts per-project tabs."""
 
+    # binary, is_installed, version; emitted from the probe thread
+    _terraform_probed = Signal(str, bool, object)
+
     def __init__(self):
         super().__init__()
 
         self.settings = Settings()
 
+        self._terraform_probed.connect(self._on_terraform_probed)
         self._init_ui()
         self._check_terraform_installed()
         self._restore_session_tabs()
@@ -184,29 +195,24 @@ class MainWindow(QMainWindow):
 
         edit_action = QAction("&Edit project in editor", self)
         edit_action.setShortcut("Ctrl+E")
-        edit_action.triggered.connect(
-            lambda: self._active_pane() and self._active_pane().on_edit_project()
-        )
+        edit_action.triggered.connect(partial(self._delegate_to_pane, "on_edit_project"))
         file_menu.addAction(edit_action)
 
         file_menu.addSeparator()
 
         import_action = QAction("&Import .tfvars...", self)
-        import_action.triggered.connect(
-            lambda: self._active_pane() and self._active_pane().on_import_tfvars()
-        )
+        import_action.triggered.connect(partial(self._delegate_to_pane, "on_import_tfvars"))
         file_menu.addAction(import_action)
 
         export_action = QAction("&Export .tfvars...", self)
-        export_action.triggered.connect(
-            lambda: self._active_pane() and self._active_pane().on_export_tfvars()
-        )
+        export_action.triggered.connect(partial(self._delegate_to_pane, "on_export_tfvars"))
         file_menu.addAction(export_action)
 
         file_menu.addSeparator()
 
         self._recent_menu = file_menu.addMenu("Recent Projects")
         self._recent_menu.aboutToShow.connect(self._rebuild_recent_menu)
+        self._create_recent_actions()
 
         file_menu.addSeparator()
 
@@ -228,14 +234,14 @@ class MainWindow(QMainWindow):
         self._state_action = QAction("&State Resources", self)
         self._state_action.setShortcut("Ctrl+Shift+S")
         self._state_action.triggered.connect(
-            lambda: self._delegate_to_pane("_show_state_viewer")
+            partial(self._delegate_to_pane, "_show_state_viewer")
         )
         self._view_menu.addAction(self._state_action)
 
         self._outputs_action = QAction("&Outputs", self)
         self._outputs_action.setShortcut("Ctrl+Shift+O")
         self._outputs_action.triggered.connect(
-            lambda: self._delegate_to_pane("_show_outputs_viewer")
+            partial(self._delegate_to_pane, "_show_outputs_viewer")
         )
         self._view_menu.addAction(self._outputs_action)
 
@@ -244,7 +250,7 @@ class MainWindow(QMainWindow):
         refresh_action = QAction("&Refresh Project", self)
         refresh_action.setShortcut("F5")
         refresh_action.triggered.connect(
-            lambda: self._delegate_to_pane("_on_refresh_project")
+            partial(self._delegate_to_pane, "_on_refresh_project")
         )
         self._view_menu.addAction(refresh_action)
 
@@ -253,13 +259,13 @@ class MainWindow(QMainWindow):
 
         new_ws_action = QAction("&New workspace in project...", self)
         new_ws_action.triggered.connect(
-            lambda: self._delegate_to_pane("_on_new_workspace")
+            partial(self._delegate_to_pane, "_on_new_workspace")
         )
         workspace_menu.addAction(new_ws_action)
 
         delete_ws_action = QAction("&Delete workspace in project...", self)
         delete_ws_action.triggered.connect(
-            lambda: self._delegate_to_pane("_on_delete_workspace")
+            partial(self._delegate_to_pane, "_on_delete_workspace")
         )
         workspace_menu.addAction(delete_ws_action)
 
@@ -267,7 +273,7 @@ class MainWindow(QMainWindow):
 
         refresh_ws_action = QAction("&Refresh List", self)
         refresh_ws_action.triggered.connect(
-            lambda: self._delegate_to_pane("_refresh_workspace_info")
+            partial(self._delegate_to_pane, "_refresh_workspace_info")
         )
         workspace_menu.addAction(refresh_ws_action)
 
@@ -294,9 +300,7 @@ class MainWindow(QMainWindow):
     def _new_tab(self, project_path: Optional[str] = None):
         pane = ProjectPane(self.settings, parent=self)
         pane.status_message.connect(self._on_pane_status_message)
-        pane.tab_title_changed.connect(
-            lambda title, p=pane: self._on_tab_title_changed(p, title)
-        )
+        pane.tab_title_changed.connect(partial(self._on_tab_title_changed, pane))
 
         label = os.path.basename(project_path) if project_path else "New Tab"
         idx = self._tab_widget.addTab(pane, label)
@@ -344,6 +348,7 @@ class MainWindow(QMainWindow):
 
         if isinstance(pane, ProjectPane):
             pane.save_state()
+            pane.shutdown()
 
         self._tab_widget.removeTab(index)
 
@@ -398,7 +403,7 @@ class MainWindow(QMainWindow):
         project_path = QFileDialog.getExistingDirectory(
             self,
             "Select Terraform Project Directory",
-            os.path.expanduser("~"),
+            _HOME_DIR,
             QFileDialog.Option.ShowDirsOnly,
         )
         if not project_path:
@@ -432,9 +437,44 @@ class MainWindow(QMainWindow):
     # ------------------------------------------------------------------
 
     def _check_terraform_installed(self):
+        """
+        Report whether terraform is available.
+
+        Answered at once when the binary is missing or its version is
+        already known; otherwise ``terraform version`` runs on a background
+        thread and the result arrives through _terraform_probed.
+        """
         terraform_binary = self.settings.get("terraform_binary", "terraform")
-        is_installed, version = validate_terraform_installed(terraform_binary)
+        known = probe_terraform_from_settings(terraform_binary, self.settings)
+        if known is not None:
+            self._report_terraform_status(*known)
+            return
 
+        probe = partial(validate_terraform_installed, terraform_binary)
+        threading.Thread(
+            target=self._run_terraform_probe,
+            args=(terraform_binary, probe),
+            daemon=True,
+        ).start()
+
+    def _run_terraform_probe(self, terraform_binary: str, probe):
+        """Background thread: run *probe* and hand the result to the GUI thread."""
+        is_installed, version = probe()
+        try:
+            self._terraform_probed.emit(terraform_binary, is_installed, version)
+        except RuntimeError:
+            pass  # window already destroyed
+
+    def _on_terraform_probed(self, terraform_binary: str, is_installed: bool,
+                             version: Optional[str]):
+        # A result for a binary that has since been changed in Settings
+        if terraform_binary != self.settings.get("terraform_binary", "terraform"):
+            return
+        if is_installed:
+            remember_terraform_probe(terraform_binary, version, self.settings)
+        self._report_terraform_status(is_installed, version)
+
+    def _report_terraform_status(self, is_installed: bool, version: Optional[str]):
         if not is_installed:
             logger.warning("Terraform not found in PATH")
             self.status_bar.showMessage(
@@ -447,25 +487,52 @@ class MainWindow(QMainWindow):
     # Recent projects
     # ------------------------------------------------------------------
 
+    def _create_recent_actions(self):
+        """Allocate the recent-project menu actions once.
+
+        The menu is refreshed every time it is shown, so the actions are
+        pooled and re-labelled rather than recreated on each refresh.
+        """
+        max_recent = self.settings.get("max_recent_projects", 10)
+        self._recent_actions = []
+        for _ in range(max_recent):
+            action = QAction(self)
+            action.triggered.connect(partial(self._on_recent_action_triggered, action))
+            self._recent_actions.append(action)
+
+        self._recent_placeholder = QAction("(No recent projects)", self)
+        self._recent_placeholder.setEnabled(False)
+
+        self._recent_separator = QAction(self)
+        self._recent_separator.setSeparator(True)
+
+        self._recent_clear_action = QAction("Clear Recent Projects", self)
+        self._recent_clear_action.triggered.connect(self._clear_recent_projects)
+
     def _rebuild_recent_menu(self):
+        # clear() only detaches the pooled actions; they are parented to the window.
         self._recent_menu.clear()
-        recent = self.settings.get_recent_projects()
+        recent = self.settings.get_recent_projects()[:len(self._recent_actions)]
 
         if not recent:
-            placeholder = QAction("(No recent projects)", self)
-            placeholder.setEnabled(False)
-            self._recent_menu.addAction(placeholder)
+            self._recent_menu.addAction(self._recent_placeholder)
             return
 
-        for path in recent:
-            action = QAction(path, self)
-            action.triggered.connect(lambda checked, p=path: self._open_project_in_tab(p))
+        for action, path in zip(self._recent_actions, recent):
+            action.setText(path)
+            action.setData(path)
+            action.setVisible(True)
             self._recent_menu.addAction(action)
+        for action in self._recent_actions[len(recent):]:
+            action.setVisible(False)
+
+        self._recent_menu.addAction(self._recent_separator)
+        self._recent_menu.addAction(self._recent_clear_action)
 
-        self._recent_menu.addSeparator()
-        clear_action = QAction("Clear Recent Projects", self)
-        clear_action.triggered.connect(self._clear_recent_projects)
-        self._recent_menu.addAction(clear_action)
+    def _on_recent_action_triggered(self, action: QAction):
+        path = action.data()
+        if path:
+            self._open_project_in_tab(path)
 
     def _clear_recent_projects(self):
         self.settings.set("recent_projects", [])
@@ -482,7 +549,6 @@ class MainWindow(QMainWindow):
             self._check_terraform_installed()
 
     def _show_about(self):
-        from .. import __version__
         QMessageBox.about(
             self,
             "About TerryGUI",
@@ -496,7 +562,8 @@ class MainWindow(QMainWindow):
     # Close
     # ------------------------------------------------------------------
 
-    def closeEvent(self, event):
+    def _persist_variables_and_window_state(self):
+        """Save every pane's variables, stop its worker and record the session."""
         self.settings.set("window.width", self.width())
         self.settings.set("window.height", self.height())
         self.settings.set("window.maximized", self.isMaximized())
@@ -506,11 +573,14 @@ class MainWindow(QMainWindow):
             pane = self._tab_widget.widget(i)
             if isinstance(pane, ProjectPane):
                 pane.save_state()
+                pane.shutdown()
                 if pane.current_project_path:
                     open_paths.append(pane.current_project_path)
 
         self.settings.set_open_projects(open_paths)
         self.settings.save()
 
+    def closeEvent(self, event):
+        self._persist_variables_and_window_state()
         logger.info("Application closing")
         event.accept()
@@ -1,11 +1,19 @@
 """Custom widgets for TerryGUI."""
 
+from ...utils._lazy import make_lazy_getattr
 from .variable_input import VariableInputWidget, VariablesPanel
 from .output_viewer import OutputViewerWidget
-from .workspace_panel import WorkspacePanelWidget
-from .state_viewer import StateViewerWidget
 from .project_pane import ProjectPane
 
+# Widgets only shown on demand are imported on first attribute access.
+_LAZY = {
+    "WorkspacePanelWidget": ".workspace_panel",
+    "StateViewerWidget": ".state_viewer",
+}
+
+__getattr__ = make_lazy_getattr(__name__, _LAZY)
+
+
 __all__ = [
     "VariableInputWidget",
     "VariablesPanel",
@@ -7,41 +7,108 @@ auto-scroll, search, and copy-to-clipboard support.
 
 import re
 import logging
-from typing import Optional
+from functools import lru_cache
+from typing import Callable, Optional
 
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTextEdit,
-    QPushButton, QLineEdit, QLabel, QApplication,
+    QWidget, QVBoxLayout, QHBoxLayout, QPlainTextEdit,
+    QPushButton, QLineEdit, QLabel,
 )
-from PySide6.QtCore import Qt, Slot
+from PySide6.QtCore import Qt, Slot, QTimer, QRegularExpression
 from PySide6.QtGui import QTextCursor, QColor, QTextCharFormat, QFont
 
 logger = logging.getLogger(__name__)
 
-# Basic ANSI color code mapping (foreground only)
-ANSI_COLORS = {
-    "30": QColor("#000000"),  # black
-    "31": QColor("#cc0000"),  # red
-    "32": QColor("#00cc00"),  # green
-    "33": QColor("#cccc00"),  # yellow
-    "34": QColor("#0000cc"),  # blue
-    "35": QColor("#cc00cc"),  # magenta
-    "36": QColor("#00cccc"),  # cyan
-    "37": QColor("#cccccc"),  # white
-    "90": QColor("#666666"),  # bright black
-    "91": QColor("#ff3333"),  # bright red
-    "92": QColor("#33ff33"),  # bright green
-    "93": QColor("#ffff33"),  # bright yellow
-    "94": QColor("#3333ff"),  # bright blue
-    "95": QColor("#ff33ff"),  # bright magenta
-    "96": QColor("#33ffff"),  # bright cyan
-    "97": QColor("#ffffff"),  # bright white
+# Basic ANSI color code mapping (foreground only), as 0xRRGGBB.  QColor
+# objects are only built for the styles that appear, via _make_format().
+ANSI_COLORS: dict[int, int] = {
+    30: 0x000000,  # black
+    31: 0xcc0000,  # red
+    32: 0x00cc00,  # green
+    33: 0xcccc00,  # yellow
+    34: 0x0000cc,  # blue
+    35: 0xcc00cc,  # magenta
+    36: 0x00cccc,  # cyan
+    37: 0xcccccc,  # white
+    90: 0x666666,  # bright black
+    91: 0xff3333,  # bright red
+    92: 0x33ff33,  # bright green
+    93: 0xffff33,  # bright yellow
+    94: 0x3333ff,  # bright blue
+    95: 0xff33ff,  # bright magenta
+    96: 0x33ffff,  # bright cyan
+    97: 0xffffff,  # bright white
 }
 
 # Regex to match ANSI escape sequences
 ANSI_ESCAPE = re.compile(r'\x1b\[([0-9;]*)m')
 
 
+# Text attributes selected by SGR codes: (foreground code, bold, italic,
+# underline).  Immutable, so it is cheap to compare and usable as a cache key.
+_SgrState = tuple[Optional[int], bool, bool, bool]
+_PLAIN: _SgrState = (None, False, False, False)
+
+
+def _sgr_reset(state: _SgrState) -> _SgrState:
+    return _PLAIN
+
+
+def _sgr_bold(state: _SgrState) -> _SgrState:
+    return (state[0], True, state[2], state[3])
+
+
+def _sgr_italic(state: _SgrState) -> _SgrState:
+    return (state[0], state[1], True, state[3])
+
+
+def _sgr_underline(state: _SgrState) -> _SgrState:
+    return (state[0], state[1], state[2], True)
+
+
+def _sgr_foreground(code: int) -> Callable[[_SgrState], _SgrState]:
+    def apply(state: _SgrState) -> _SgrState:
+        return (code, state[1], state[2], state[3])
+    return apply
+
+
+# SGR code -> handler returning the updated state; unknown codes are ignored
+_SGR_HANDLERS: dict[int, Callable[[_SgrState], _SgrState]] = {
+    0: _sgr_reset,
+    1: _sgr_bold,
+    3: _sgr_italic,
+    4: _sgr_underline,
+    **{code: _sgr_foreground(code) for code in ANSI_COLORS},
+}
+
+
+@lru_cache(maxsize=256)
+def _make_format(state: _SgrState) -> QTextCharFormat:
+    """Return the shared char format for an SGR state.  Do not mutate it."""
+    fmt = QTextCharFormat()
+    fg, bold, italic, underline = state
+    if fg is not None:
+        fmt.setForeground(QColor(ANSI_COLORS[fg]))
+    if bold:
+        fmt.setFontWeight(QFont.Weight.Bold)
+    if italic:
+        fmt.setFontItalic(True)
+    if underline:
+        fmt.setFontUnderline(True)
+    return fmt
+
+
+@lru_cache(maxsize=16)
+def _search_pattern(query: str) -> QRegularExpression:
+    """Return a compiled, case-insensitive literal pattern for *query*."""
+    pattern = QRegularExpression(
+        QRegularExpression.escape(query),
+        QRegularExpression.PatternOption.CaseInsensitiveOption,
+    )
+    pattern.optimize()
+    return pattern
+
+
 class OutputViewerWidget(QWidget):
     """
     Displays streaming Terraform output with ANSI color rendering.
@@ -52,18 +119,26 @@ class OutputViewerWidget(QWidget):
     - Copy to clipboard
     - Clear output
     - Search within output
-    - Line count limit (default 10,000)
+    - Line count limit (default 10,000); the oldest lines are evicted
     """
 
     MAX_LINES = 10000
+    # Appends within this window are written and scrolled as one update
+    FLUSH_INTERVAL_MS = 20
 
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
         self._line_count = 0
         self._auto_scroll = True
-        self._current_format = QTextCharFormat()
+        self._sgr_state: _SgrState = _PLAIN
+        self._pending: list[str] = []
         self._init_ui()
 
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self._flush)
+
     def _init_ui(self):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -96,33 +171,46 @@ class OutputViewerWidget(QWidget):
 
         layout.addLayout(toolbar)
 
-        # Output text area
-        self._text_edit = QTextEdit()
+        # Output text area.  QPlainTextEdit lays out per block rather than
+        # the whole rich-text document, which suits a streaming log.
+        self._text_edit = QPlainTextEdit()
         self._text_edit.setReadOnly(True)
         self._text_edit.setFont(QFont("Consolas", 10))
-        self._text_edit.setLineWrapMode(QTextEdit.LineWrapMode.WidgetWidth)
+        self._text_edit.setLineWrapMode(QPlainTextEdit.LineWrapMode.WidgetWidth)
+        # Bound the document so long runs keep a constant append cost
+        self._text_edit.setMaximumBlockCount(self.MAX_LINES)
         layout.addWidget(self._text_edit)
 
     @Slot(str)
     def append_output(self, text: str):
         """
-        Append a line of output, parsing any ANSI color codes.
+        Append output, parsing any ANSI color codes.
+
+        Text is queued and written on the next flush, so bursts of appends
+        cost one document update and one scroll.
 
         Args:
-            text: A single line of output (may contain ANSI escapes).
+            text: One line, or several newline-separated lines (may contain
+                ANSI escapes).
         """
-        # Enforce line limit
-        if self._line_count >= self.MAX_LINES:
+        self._pending.append(text)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush(self):
+        """Write queued output to the document and follow it if enabled."""
+        if not self._pending:
             return
+        text = "\n".join(self._pending)
+        self._pending = []
 
         cursor = self._text_edit.textCursor()
         cursor.movePosition(QTextCursor.MoveOperation.End)
 
-        if self._line_count > 0:
-            cursor.insertText("\n")
-
-        self._insert_ansi_text(cursor, text)
-        self._line_count += 1
+        # The separator goes in with the text: one insert for plain lines
+        self._insert_ansi_text(cursor, "\n" + text if self._line_count > 0 else text)
+        # The document drops its oldest blocks beyond MAX_LINES
+        self._line_count = min(self._line_count + text.count("\n") + 1, self.MAX_LINES)
 
         if self._auto_scroll:
             scrollbar = self._text_edit.verticalScrollBar()
@@ -130,43 +218,56 @@ class OutputViewerWidget(QWidget):
 
     def _insert_ansi_text(self, cursor: QTextCursor, text: str):
         """Parse ANSI escape codes and insert formatted text segments."""
-        last_end = 0
-
-        for match in ANSI_ESCAPE.finditer(text):
-            # Insert text before this escape sequence
-            start = match.start()
-            if start > last_end:
-                cursor.insertText(text[last_end:start], self._current_format)
-
-            # Update format based on ANSI codes
-            codes = match.group(1).split(";")
-            self._apply_ansi_codes(codes)
-            last_end = match.end()
+        # Fast path: most terraform output carries no escape sequences
+        if "\x1b" not in text:
+            cursor.insertText(text, _make_format(self._sgr_state))
+            return
 
-        # Insert remaining text after last escape
-        if last_end < len(text):
-            cursor.insertText(text[last_end:], self._current_format)
+        # (pieces, state) runs, joined and resolved to cached formats when
+        # inserted.  Pieces are collected in a list: a long burst in one
+        # state would otherwise be re-copied on every concatenation.
+        segments: list[tuple[list[str], _SgrState]] = []
+
+        def push(segment: str):
+            if segments and segments[-1][1] == self._sgr_state:
+                # Same state as the previous run: merge into one insert
+                segments[-1][0].append(segment)
+            else:
+                segments.append(([segment], self._sgr_state))
+
+        # split() with one capture group yields text, codes, text, codes, ...
+        # in a single pass, without building a match object per escape
+        parts = ANSI_ESCAPE.split(text)
+        if parts[0]:
+            push(parts[0])
+        for i in range(1, len(parts), 2):
+            self._apply_ansi_codes(parts[i].split(";"))
+            if parts[i + 1]:
+                push(parts[i + 1])
+
+        for pieces, state in segments:
+            cursor.insertText("".join(pieces), _make_format(state))
 
     def _apply_ansi_codes(self, codes: list[str]):
-        """Apply ANSI SGR codes to the current text format."""
+        """Apply ANSI SGR codes to the current text state."""
+        state = self._sgr_state
         for code in codes:
-            if code in ("0", ""):
-                # Reset
-                self._current_format = QTextCharFormat()
-            elif code == "1":
-                self._current_format.setFontWeight(QFont.Weight.Bold)
-            elif code == "3":
-                self._current_format.setFontItalic(True)
-            elif code == "4":
-                self._current_format.setFontUnderline(True)
-            elif code in ANSI_COLORS:
-                self._current_format.setForeground(ANSI_COLORS[code])
+            # An empty parameter means 0 (reset)
+            try:
+                handler = _SGR_HANDLERS.get(int(code) if code else 0)
+            except ValueError:
+                continue
+            if handler is not None:
+                state = handler(state)
+        self._sgr_state = state
 
     def clear(self):
         """Clear all output."""
+        self._flush_timer.stop()
+        self._pending = []
         self._text_edit.clear()
         self._line_count = 0
-        self._current_format = QTextCharFormat()
+        self._sgr_state = _PLAIN
 
     def set_label(self, text: str):
         """Set the output header label text."""
@@ -174,29 +275,41 @@ class OutputViewerWidget(QWidget):
 
     def _on_copy(self):
         """Copy all output text to clipboard."""
-        clipboard = QApplication.clipboard()
-        if clipboard is not None:
-            clipboard.setText(self._text_edit.toPlainText())
+        self._flush()
+        # Let the editor's own copy path build the clipboard data from the
+        # selection instead of materialising toPlainText() first.
+        saved_cursor = self._text_edit.textCursor()
+        scrollbar = self._text_edit.verticalScrollBar()
+        saved_scroll = scrollbar.value()
+        self._text_edit.selectAll()
+        self._text_edit.copy()
+        self._text_edit.setTextCursor(saved_cursor)
+        scrollbar.setValue(saved_scroll)
 
     def _on_search(self):
         """Find and highlight the next occurrence of the search text."""
         query = self._search_input.text()
         if not query:
             return
+        self._flush()
 
-        # Search from current cursor position
-        found = self._text_edit.find(query)
+        # Search from current cursor position; repeated "find next" presses
+        # reuse the compiled pattern
+        pattern = _search_pattern(query)
+        found = self._text_edit.find(pattern)
         if not found:
             # Wrap around to the beginning
             cursor = self._text_edit.textCursor()
             cursor.movePosition(QTextCursor.MoveOperation.Start)
             self._text_edit.setTextCursor(cursor)
-            self._text_edit.find(query)
+            self._text_edit.find(pattern)
 
     def get_text(self) -> str:
         """Return all output as plain text."""
+        self._flush()
         return self._text_edit.toPlainText()
 
     def line_count(self) -> int:
         """Return the current number of output lines."""
+        self._flush()
         return self._line_count
@@ -6,14 +6,23 @@ multiple panes via a QTabWidget and delegates all project-specific work here.
 """
 
 import os
+import glob
 import logging
-from typing import Optional
+import shutil
+import subprocess
+import threading
+from functools import partial
+from typing import TYPE_CHECKING, Optional
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QPushButton, QMessageBox, QCheckBox, QFrame, QDialog, QSplitter,
+    QFileDialog,
 )
-from PySide6.QtCore import Qt, QThread, Signal, QObject
+from PySide6.QtCore import (
+    Qt, QThread, QTimer, Signal, Slot, QObject, QUrl, QFileSystemWatcher,
+)
+from PySide6.QtGui import QDesktopServices
 
 from ...config import Settings
 from ...core import (
@@ -21,76 +30,134 @@ from ...core import (
     CommandResult, WorkspaceManager, StateManager,
 )
 from ...core.tfvars_handler import TfvarsHandler
-from ...utils import validators
+from ...utils import validators, subprocess_creation_flags
 from ...security import InputSanitizer, SecurityError
 
 from .variable_input import VariablesPanel
 from .output_viewer import OutputViewerWidget
-from .state_viewer import StateViewerWidget
 from ..dialogs.confirm_dialog import ConfirmDialog
 
+if TYPE_CHECKING:
+    from .state_viewer import StateViewerWidget
+
 logger = logging.getLogger(__name__)
 
+# Starting directory for file dialogs, resolved once
+_HOME_DIR = os.path.expanduser("~")
+
+# Editors that register an OS URL handler able to open a folder, keyed by
+# editor command.  Used when the command itself is not on PATH.
+_EDITOR_URL_SCHEMES = {
+    "code": "vscode",
+    "codium": "vscodium",
+}
+
+
+def _editor_url(editor_command: str, path: str) -> Optional[QUrl]:
+    """Return a ``<scheme>://file/<path>`` URL for known editors, else None."""
+    scheme = _EDITOR_URL_SCHEMES.get(editor_command)
+    if scheme is None:
+        return None
+    url = QUrl()
+    url.setScheme(scheme)
+    url.setHost("file")
+    url.setPath(QUrl.fromLocalFile(path).path())
+    return url
+
 
 # ---------------------------------------------------------------------------
 # Worker for running Terraform commands off the UI thread
 # ---------------------------------------------------------------------------
 
 class _OperationWorker(QObject):
-    """Runs a TerraformRunner operation in a background thread."""
+    """Runs TerraformRunner operations on a long-lived background thread.
 
-    line_output = Signal(str)
-    finished = Signal(object)  # emits CommandResult
+    One worker lives per pane for the pane's lifetime; each operation is
+    delivered to invoke() through a queued signal connection.
 
-    def __init__(self, runner: TerraformRunner, operation: str,
-                 variables: Optional[dict] = None,
-                 var_types: Optional[dict] = None,
-                 auto_approve: bool = False):
-        super().__init__()
-        self.runner = runner
-        self.operation = operation
-        self.variables = variables
-        self.var_types = var_types
-        self.auto_approve = auto_approve
+    Output lines are buffered and emitted as newline-joined chunks, either
+    when FLUSH_LINES accumulate or when the pane calls flush_output() from
+    its UI-thread timer, so bursts cost one cross-thread event per chunk.
+    """
+
+    line_output = Signal(str)  # one or more newline-separated lines
+    finished = Signal(object, bool)  # CommandResult, stderr already streamed
+
+    FLUSH_LINES = 64
 
-    def run(self):
+    def __init__(self):
+        super().__init__()
+        # stdout and stderr are read on different threads
+        self._buf: list[str] = []
+        self._buf_lock = threading.Lock()
+
+    def _buffer_line(self, line: str):
+        """Output callback: queue a line, emitting once the buffer is full."""
+        with self._buf_lock:
+            self._buf.append(line)
+            if len(self._buf) >= self.FLUSH_LINES:
+                self._emit_buffer()
+
+    def flush_output(self):
+        """Emit any buffered lines.  Safe to call from any thread."""
+        with self._buf_lock:
+            if self._buf:
+                self._emit_buffer()
+
+    def _emit_buffer(self):
+        # Caller holds _buf_lock; emitting under the lock keeps chunks in order.
+        chunk = "\n".join(self._buf)
+        self._buf = []
+        self.line_output.emit(chunk)
+
+    @Slot(object, str, object, object, bool)
+    def invoke(self, runner: TerraformRunner, operation: str,
+               variables: Optional[dict] = None,
+               var_types: Optional[dict] = None,
+               auto_approve: bool = False):
         """Execute the operation and emit result when done."""
+        # The runner streams its stderr through the output callback; only
+        # results synthesised here carry stderr the viewer has not seen.
+        stderr_streamed = True
         try:
-            if self.operation == "init":
-                result = self.runner.init(output_callback=self.line_output.emit)
-            elif self.operation == "validate":
-                result = self.runner.validate(output_callback=self.line_output.emit)
-            elif self.operation == "plan":
-                result = self.runner.plan(
-                    variables=self.variables or {},
-                    var_types=self.var_types or {},
-                    output_callback=self.line_output.emit,
+            if operation == "init":
+                result = runner.init(output_callback=self._buffer_line)
+            elif operation == "validate":
+                result = runner.validate(output_callback=self._buffer_line)
+            elif operation == "plan":
+                result = runner.plan(
+                    variables=variables or {},
+                    var_types=var_types or {},
+                    output_callback=self._buffer_line,
                 )
-            elif self.operation == "apply":
-                result = self.runner.apply(
-                    variables=self.variables or {},
-                    var_types=self.var_types or {},
-                    auto_approve=self.auto_approve,
-                    output_callback=self.line_output.emit,
+            elif operation == "apply":
+                result = runner.apply(
+                    variables=variables or {},
+                    var_types=var_types or {},
+                    auto_approve=auto_approve,
+                    output_callback=self._buffer_line,
                 )
-            elif self.operation == "destroy":
-                result = self.runner.destroy(
-                    variables=self.variables or {},
-                    var_types=self.var_types or {},
-                    auto_approve=self.auto_approve,
-                    output_callback=self.line_output.emit,
+            elif operation == "destroy":
+                result = runner.destroy(
+                    variables=variables or {},
+                    var_types=var_types or {},
+                    auto_approve=auto_approve,
+                    output_callback=self._buffer_line,
                 )
             else:
+                stderr_streamed = False
                 result = CommandResult(
-                    exit_code=1, stdout="", stderr=f"Unknown operation: {self.operation}",
-                    success=False, command=self.operation,
+                    exit_code=1, stdout="", stderr=f"Unknown operation: {operation}",
+                    success=False, command=operation,
                 )
         except Exception as exc:
+            stderr_streamed = False
             result = CommandResult(
                 exit_code=1, stdout="", stderr=str(exc),
-                success=False, command=self.operation,
+                success=False, command=operation,
             )
-        self.finished.emit(result)
+        self.flush_output()
+        self.finished.emit(result, stderr_streamed)
 
 
 # ---------------------------------------------------------------------------
@@ -114,6 +181,16 @@ class ProjectPane(QWidget):
 
     # Internal signal for thread-safe output relay
     _relay_output = Signal(str)
+    # Queued hand-off to the worker thread:
+    # (runner, operation, variables, var_types, auto_approve)
+    _start_operation = Signal(object, str, object, object, bool)
+
+    # Delay before recent/last-project changes are flushed to settings.json
+    SETTINGS_FLUSH_DELAY_MS = 2000
+    # Maximum latency for streamed output lines to reach the viewer
+    OUTPUT_FLUSH_INTERVAL_MS = 50
+    # Quiet period after a .tf change before variables are re-parsed
+    FILE_CHANGE_DEBOUNCE_MS = 500
 
     def __init__(self, settings: Settings, parent=None):
         super().__init__(parent)
@@ -125,9 +202,12 @@ class ProjectPane(QWidget):
         self.project_manager: Optional[ProjectManager] = None
         self.terraform_parser: Optional[TerraformParser] = None
         self.terraform_runner: Optional[TerraformRunner] = None
+        # Runners already built by this pane, keyed by (path, terraform binary)
+        self._runners: dict[tuple[str, str], TerraformRunner] = {}
         self.workspace_manager: Optional[WorkspaceManager] = None
         self.state_manager: Optional[StateManager] = None
         self._state_dialog: Optional[QDialog] = None
+        self._state_viewer: Optional["StateViewerWidget"] = None
 
         # Variable counts (for info bar)
         self._var_count: int = 0
@@ -136,8 +216,13 @@ class ProjectPane(QWidget):
         # Background operation state
         self._worker: Optional[_OperationWorker] = None
         self._worker_thread: Optional[QThread] = None
+        self._running: bool = False
         self._init_done = False
-        self._pending_result: Optional[CommandResult] = None
+
+        # Set when the watcher reports a .tf change not yet re-parsed
+        self._vars_dirty: bool = False
+        # The project's .tf files as of the last watch
+        self._tf_files: frozenset = frozenset()
 
         self._init_ui()
         self._update_button_states()
@@ -173,18 +258,18 @@ class ProjectPane(QWidget):
         self.init_button = QPushButton("Init")
         self.init_button.setToolTip("Run terraform init (Ctrl+I)")
         self.init_button.setShortcut("Ctrl+I")
-        self.init_button.clicked.connect(lambda: self._run_operation("init"))
+        self.init_button.clicked.connect(partial(self._run_operation, "init"))
         buttons_layout.addWidget(self.init_button)
 
         self.validate_button = QPushButton("Validate")
         self.validate_button.setToolTip("Run terraform validate")
-        self.validate_button.clicked.connect(lambda: self._run_operation("validate"))
+        self.validate_button.clicked.connect(partial(self._run_operation, "validate"))
         buttons_layout.addWidget(self.validate_button)
 
         self.plan_button = QPushButton("Plan")
         self.plan_button.setToolTip("Run terraform plan (Ctrl+P)")
         self.plan_button.setShortcut("Ctrl+P")
-        self.plan_button.clicked.connect(lambda: self._run_operation("plan"))
+        self.plan_button.clicked.connect(partial(self._run_operation, "plan"))
         buttons_layout.addWidget(self.plan_button)
 
         self.apply_button = QPushButton("Apply")
@@ -207,6 +292,7 @@ class ProjectPane(QWidget):
 
         self.debug_checkbox = QCheckBox("Debug output")
         self.debug_checkbox.setToolTip("Show verbose terraform output")
+        self.debug_checkbox.toggled.connect(self._on_debug_toggled)
         buttons_layout.addWidget(self.debug_checkbox)
 
         main_layout.addLayout(buttons_layout)
@@ -214,12 +300,27 @@ class ProjectPane(QWidget):
         # Thread-safe output relay
         self._relay_output.connect(self.output_viewer.append_output)
 
+        # Drains the worker's output buffer while an operation is running
+        self._output_flush_timer = QTimer(self)
+        self._output_flush_timer.setInterval(self.OUTPUT_FLUSH_INTERVAL_MS)
+        self._output_flush_timer.timeout.connect(self._flush_worker_output)
+
+        # Re-parse variables only when the OS reports a .tf change
+        self._fs_watcher = QFileSystemWatcher(self)
+        self._fs_watcher.fileChanged.connect(self._on_project_files_changed)
+        self._fs_watcher.directoryChanged.connect(self._on_project_files_changed)
+
+        self._fs_refresh_timer = QTimer(self)
+        self._fs_refresh_timer.setSingleShot(True)
+        self._fs_refresh_timer.setInterval(self.FILE_CHANGE_DEBOUNCE_MS)
+        self._fs_refresh_timer.timeout.connect(self._on_project_files_settled)
+
     # ------------------------------------------------------------------
     # Button state machine
     # ------------------------------------------------------------------
 
     def _update_button_states(self):
-        running = self._worker_thread is not None and self._worker_thread.isRunning()
+        running = self._running
         has_project = self.current_project_path is not None
 
         self.init_button.setEnabled(has_project and not running)
@@ -233,9 +334,50 @@ class ProjectPane(QWidget):
     # Terraform operations
     # ------------------------------------------------------------------
 
+    def _ensure_worker(self):
+        """Create and start the pane's worker thread on first use."""
+        if self._worker_thread is not None:
+            return
+
+        worker = _OperationWorker()
+        thread = QThread(self)
+        worker.moveToThread(thread)
+
+        self._start_operation.connect(worker.invoke)
+        # Queued even when flush_output() runs on the UI thread, so chunks
+        # are appended in the order they were emitted.
+        worker.line_output.connect(
+            self._relay_output, Qt.ConnectionType.QueuedConnection
+        )
+        worker.finished.connect(self._on_operation_finished)
+        thread.finished.connect(worker.deleteLater)
+
+        self._worker = worker
+        self._worker_thread = thread
+        thread.start()
+
+    def _flush_worker_output(self):
+        if self._worker is not None:
+            self._worker.flush_output()
+
+    def shutdown(self):
+        """Cancel any running operation and stop the worker thread."""
+        self._fs_refresh_timer.stop()
+        if self._worker_thread is None:
+            return
+        if self._running and self.terraform_runner:
+            self.terraform_runner.cancel()
+        self._worker_thread.quit()
+        self._worker_thread.wait()
+        self._worker_thread.deleteLater()
+        self._worker_thread = None
+        self._worker = None
+        self._running = False
+        self._output_flush_timer.stop()
+
     def _run_operation(self, operation: str):
-        """Start a terraform operation in a background thread."""
-        if self.terraform_runner is None or self._worker_thread is not None:
+        """Start a terraform operation on the worker thread."""
+        if self.terraform_runner is None or self._running:
             return
 
         self.output_viewer.clear()
@@ -258,46 +400,20 @@ class ProjectPane(QWidget):
         if operation in ("apply", "destroy"):
             auto_approve = True
 
-        worker = _OperationWorker(
-            self.terraform_runner, operation,
-            variables=variables, var_types=var_types,
-            auto_approve=auto_approve,
-        )
-        thread = QThread()
-        worker.moveToThread(thread)
-
-        thread.started.connect(worker.run)
-        worker.line_output.connect(self._relay_output)
-        worker.finished.connect(self._store_result)
-        worker.finished.connect(thread.quit)
-        thread.finished.connect(self._on_thread_finished)
-
-        self._worker = worker
-        self._worker_thread = thread
-        self._pending_result = None
+        self._ensure_worker()
+        self._running = True
+        # A pending reload waits for the operation; _vars_dirty keeps it
+        self._fs_refresh_timer.stop()
         self._update_button_states()
+        self._output_flush_timer.start()
 
-        thread.start()
-
-    def _store_result(self, result: CommandResult):
-        self._pending_result = result
-
-    def _on_thread_finished(self):
-        result = self._pending_result
-        self._pending_result = None
-
-        if self._worker is not None:
-            self._worker.moveToThread(self.thread())
-            self._worker.deleteLater()
-            self._worker = None
-        if self._worker_thread is not None:
-            self._worker_thread.deleteLater()
-            self._worker_thread = None
-
-        if result is not None:
-            self._on_operation_finished(result)
+        self._start_operation.emit(
+            self.terraform_runner, operation, variables, var_types, auto_approve,
+        )
 
-    def _on_operation_finished(self, result: CommandResult):
+    def _on_operation_finished(self, result: CommandResult, stderr_streamed: bool = False):
+        self._running = False
+        self._output_flush_timer.stop()
         if result.success:
             self.status_message.emit(
                 f"terraform {result.command} completed successfully"
@@ -309,9 +425,11 @@ class ProjectPane(QWidget):
             self.status_message.emit(
                 f"terraform {result.command} failed (exit code {result.exit_code})"
             )
-            if result.stderr and result.stderr not in self.output_viewer.get_text():
+            if result.stderr and not stderr_streamed:
                 self.output_viewer.append_output(result.stderr)
 
+        if self._vars_dirty:
+            self._fs_refresh_timer.start()
         self._update_button_states()
 
     def _on_cancel(self):
@@ -438,35 +556,39 @@ class ProjectPane(QWidget):
     # ------------------------------------------------------------------
 
     def _get_or_create_state_dialog(self):
-        from PySide6.QtWidgets import QVBoxLayout as _QVBoxLayout
+        """Return the state dialog, building it on first use only.
 
-        if self._state_dialog is not None and self._state_dialog.isVisible():
-            return self._state_dialog
+        The dialog is kept alive after it is closed; reopening only re-binds
+        the viewer when the pane's StateManager has changed (project reload).
+        """
+        if self._state_dialog is None:
+            # Deferred: most sessions never open the state viewer.
+            from .state_viewer import StateViewerWidget
 
-        dialog = QDialog(self)
-        dialog.setWindowTitle("Terraform State")
-        dialog.resize(700, 500)
+            dialog = QDialog(self)
+            dialog.setWindowTitle("Terraform State")
+            dialog.resize(700, 500)
 
-        layout = _QVBoxLayout(dialog)
-        viewer = StateViewerWidget()
-        layout.addWidget(viewer)
+            layout = QVBoxLayout(dialog)
+            self._state_viewer = StateViewerWidget()
+            layout.addWidget(self._state_viewer)
 
-        if self.state_manager:
-            viewer.set_manager(self.state_manager)
+            self._state_dialog = dialog
 
-        dialog._viewer = viewer
-        self._state_dialog = dialog
-        return dialog
+        if self.state_manager and self._state_viewer.manager() is not self.state_manager:
+            self._state_viewer.set_manager(self.state_manager)
+
+        return self._state_dialog
 
     def _show_state_viewer(self):
         dialog = self._get_or_create_state_dialog()
-        dialog._viewer.show_resources_view()
+        self._state_viewer.show_resources_view()
         dialog.show()
         dialog.raise_()
 
     def _show_outputs_viewer(self):
         dialog = self._get_or_create_state_dialog()
-        dialog._viewer.show_outputs_view()
+        self._state_viewer.show_outputs_view()
         dialog.show()
         dialog.raise_()
 
@@ -505,14 +627,19 @@ class ProjectPane(QWidget):
 
         terraform_binary = self.settings.get("terraform_binary", "terraform")
         debug = self.debug_checkbox.isChecked()
-        try:
-            self.terraform_runner = TerraformRunner(
-                project_path=safe_path,
-                terraform_binary=terraform_binary,
-                debug=debug,
-            )
-        except SecurityError as e:
-            raise ValueError(f"Failed to create runner: {e}")
+        runner = self._runners.get((safe_path, terraform_binary))
+        if runner is None:
+            try:
+                runner = TerraformRunner(
+                    project_path=safe_path,
+                    terraform_binary=terraform_binary,
+                    debug=debug,
+                )
+            except SecurityError as e:
+                raise ValueError(f"Failed to create runner: {e}")
+            self._runners[(safe_path, terraform_binary)] = runner
+        runner.debug = debug
+        self.terraform_runner = runner
 
         try:
             self.workspace_manager = WorkspaceManager(
@@ -542,6 +669,7 @@ class ProjectPane(QWidget):
             self._var_count = var_count
             self._sensitive_count = sensitive_count
             logger.info(f"Parsed {var_count} variables ({sensitive_count} sensitive)")
+            self._vars_dirty = False
 
             self.status_message.emit(self.get_status_text(prefix="Project loaded"))
         except Exception as e:
@@ -551,12 +679,16 @@ class ProjectPane(QWidget):
                 f"Project loaded but failed to parse some variables:\n{str(e)}",
             )
 
+        self._watch_project_files()
+
         self._update_button_states()
         self._update_info()  # emits tab_title_changed + status_message
 
         self.settings.add_recent_project(safe_path)
         self.settings.set_last_project(safe_path)
-        self.settings.save()
+        # Deferred: several tabs restored at startup share one write, and
+        # MainWindow.closeEvent performs the final synchronous save.
+        QTimer.singleShot(self.SETTINGS_FLUSH_DELAY_MS, self.settings.flush)
 
         self.project_loaded.emit(safe_path)
 
@@ -571,9 +703,16 @@ class ProjectPane(QWidget):
             return
 
         editor_command = self.settings.get("editor_command", "code")
+
+        # The URL handler is only a fallback: on Linux openUrl() reports
+        # success once xdg-open starts, even with no handler registered.
+        if shutil.which(editor_command) is None:
+            url = _editor_url(editor_command, self.current_project_path)
+            if url is not None and QDesktopServices.openUrl(url):
+                logger.info(f"Opened project in {editor_command} via {url.scheme()} URL")
+                return
+
         try:
-            import subprocess
-            from ...utils import subprocess_creation_flags
             subprocess.Popen(
                 [editor_command, self.current_project_path],
                 creationflags=subprocess_creation_flags(),
@@ -587,17 +726,84 @@ class ProjectPane(QWidget):
                 f"Make sure '{editor_command}' is installed and in PATH.",
             )
 
+    def _on_debug_toggled(self, checked: bool):
+        if self.terraform_runner is not None:
+            self.terraform_runner.debug = checked
+
+    def _watch_project_files(self):
+        """Point the file watcher at the project directory and its .tf files."""
+        watched = self._fs_watcher.files() + self._fs_watcher.directories()
+        if watched:
+            self._fs_watcher.removePaths(watched)
+        tf_files = glob.glob(os.path.join(self.current_project_path, "*.tf"))
+        self._tf_files = frozenset(tf_files)
+        self._fs_watcher.addPaths([self.current_project_path, *tf_files])
+
+    def _on_project_files_changed(self, path: str):
+        # The directory also changes when terraform writes its lock, state
+        # and plan files; only an added or removed .tf file matters there
+        if path == self.current_project_path and frozenset(
+            glob.glob(os.path.join(path, "*.tf"))
+        ) == self._tf_files:
+            return
+
+        self._vars_dirty = True
+        # Reloading mid-run would replace the panel under the operation;
+        # _on_operation_finished starts the timer instead
+        if not self._running:
+            # Restarting the single-shot timer coalesces bursts of saves
+            self._fs_refresh_timer.start()
+
+    def _on_project_files_settled(self):
+        if not self.current_project_path or self._running:
+            return
+        # Saving a file must not silently drop the secrets the user entered
+        self._reload_variables(keep_sensitive=True)
+        self._update_info()
+
+    def _reload_variables(self, keep_sensitive: bool = False):
+        """
+        Re-parse the project's variables into the panel, keeping entered values.
+
+        Sensitive values are kept only with *keep_sensitive*, and only for
+        variables that are still sensitive with the same type.  They stay in
+        memory; load_variables() never restores them from saved values.
+        """
+        self._vars_dirty = False
+        if not self.terraform_parser:
+            return
+        # Editors that save by replacing the file drop it from the watcher
+        self._watch_project_files()
+        try:
+            variables = self.terraform_parser.parse_variables()
+            panel = self.variables_panel
+            current_values = panel.get_non_sensitive_values()
+            secrets = {}
+            if keep_sensitive:
+                old_types = dict(panel.get_var_types())
+                secrets = {
+                    name: value for name, value in panel.get_all_values().items()
+                    if name in panel.get_sensitive_names()
+                }
+            panel.load_variables(variables, current_values)
+            if secrets:
+                new_types = panel.get_var_types()
+                sensitive = panel.get_sensitive_names()
+                panel.set_values({
+                    name: value for name, value in secrets.items()
+                    if name in sensitive and new_types.get(name) == old_types[name]
+                })
+        except Exception as e:
+            logger.error(f"Failed to refresh variables: {e}")
+
     def _on_refresh_project(self):
         if not self.current_project_path:
             return
 
-        if self.terraform_parser:
-            try:
-                variables = self.terraform_parser.parse_variables()
-                current_values = self.variables_panel.get_non_sensitive_values()
-                self.variables_panel.load_variables(variables, current_values)
-            except Exception as e:
-                logger.error(f"Failed to refresh variables: {e}")
+        # Always re-parse: the watcher can miss changes (network filesystems,
+        # atomic saves), and parse_variables is cached on the files' mtimes
+        self._fs_refresh_timer.stop()
+        self._reload_variables()
 
         self._update_info()
         self.status_message.emit("Project refreshed")
@@ -607,11 +813,10 @@ class ProjectPane(QWidget):
     # ------------------------------------------------------------------
 
     def on_import_tfvars(self):
-        from PySide6.QtWidgets import QFileDialog
         file_path, _ = QFileDialog.getOpenFileName(
             self,
             "Import .tfvars File",
-            self.current_project_path or os.path.expanduser("~"),
+            self.current_project_path or _HOME_DIR,
             "Terraform Variable Files (*.tfvars *.tfvars.json);;All Files (*)",
         )
         if not file_path:
@@ -630,12 +835,11 @@ class ProjectPane(QWidget):
             )
 
     def on_export_tfvars(self):
-        from PySide6.QtWidgets import QFileDialog
         file_path, _ = QFileDialog.getSaveFileName(
             self,
             "Export .tfvars File",
             os.path.join(
-                self.current_project_path or os.path.expanduser("~"),
+                self.current_project_path or _HOME_DIR,
                 "terraform.tfvars",
             ),
             "Terraform Variable Files (*.tfvars);;All Files (*)",
@@ -664,10 +868,9 @@ class ProjectPane(QWidget):
         """Persist non-sensitive vars + project manager state. Called on tab close."""
         if self.project_manager:
             non_sensitive = self.variables_panel.get_non_sensitive_values()
-            for name, value in non_sensitive.items():
-                self.project_manager.set_variable_value(name, value)
+            self.project_manager.set_variables_bulk(non_sensitive)
             self.project_manager.save()
 
     def is_operation_running(self) -> bool:
         """Return True if a background operation is in progress."""
-        return self._worker_thread is not None and self._worker_thread.isRunning()
+        return self._running
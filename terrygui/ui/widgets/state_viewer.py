@@ -11,10 +11,10 @@ from typing import Optional
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QSplitter,
-    QListWidget, QTextEdit, QPushButton, QLabel,
+    QListView, QTextEdit, QPushButton, QLabel,
     QButtonGroup,
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QModelIndex, QStringListModel
 from PySide6.QtGui import QFont
 
 from ...core.state_manager import StateManager
@@ -35,6 +35,9 @@ class StateViewerWidget(QWidget):
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
         self._manager: Optional[StateManager] = None
+        # Resources from the last list, and `state show` output fetched for
+        # them so far; both are rebuilt when the list is (re)loaded.
+        self._details_cache: dict[str, str] = {}
         self._init_ui()
 
     def _init_ui(self):
@@ -54,8 +57,15 @@ class StateViewerWidget(QWidget):
         # --- Splitter: resource list + detail view ---
         self._splitter = QSplitter(Qt.Orientation.Horizontal)
 
-        self._resource_list = QListWidget()
-        self._resource_list.currentRowChanged.connect(self._on_resource_selected)
+        # A plain string model avoids one QListWidgetItem per resource
+        self._resource_model = QStringListModel(self)
+        self._resource_list = QListView()
+        self._resource_list.setModel(self._resource_model)
+        self._resource_list.setUniformItemSizes(True)
+        self._resource_list.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
+        self._resource_list.selectionModel().currentRowChanged.connect(
+            self._on_resource_selected
+        )
         self._splitter.addWidget(self._resource_list)
 
         self._detail_view = QTextEdit()
@@ -89,6 +99,10 @@ class StateViewerWidget(QWidget):
         toggle_layout.addStretch()
         layout.addLayout(toggle_layout)
 
+    def manager(self) -> Optional[StateManager]:
+        """Return the StateManager currently bound to this viewer."""
+        return self._manager
+
     def set_manager(self, manager: StateManager) -> None:
         """Set the StateManager and load initial data."""
         self._manager = manager
@@ -103,8 +117,9 @@ class StateViewerWidget(QWidget):
 
     def _load_resources(self):
         """Fetch and display the resource list."""
-        self._resource_list.clear()
+        self._resource_model.setStringList([])
         self._detail_view.clear()
+        self._details_cache = {}
 
         if not self._manager:
             self._count_label.setText("State Resources")
@@ -113,8 +128,7 @@ class StateViewerWidget(QWidget):
         resources = self._manager.list_resources()
         self._count_label.setText(f"State Resources ({len(resources)})")
 
-        for res in resources:
-            self._resource_list.addItem(res.address)
+        self._resource_model.setStringList([res.address for res in resources])
 
     def _load_outputs(self):
         """Fetch and display terraform outputs."""
@@ -126,18 +140,19 @@ class StateViewerWidget(QWidget):
         output = self._manager.get_outputs()
         self._detail_view.setPlainText(output)
 
-    def _on_resource_selected(self, row: int):
+    def _on_resource_selected(self, current: QModelIndex, previous: QModelIndex):
         """Load details for the selected resource."""
-        if row < 0 or not self._manager:
+        if not current.isValid() or not self._manager:
             self._detail_view.clear()
             return
 
-        item = self._resource_list.item(row)
-        if item is None:
-            return
-
-        address = item.text()
-        details = self._manager.get_resource_details(address)
+        # Each lookup runs `terraform state show`; revisiting a row while
+        # browsing reuses the earlier result until the list is refreshed.
+        address = current.data()
+        details = self._details_cache.get(address)
+        if details is None:
+            details = self._manager.get_resource_details(address)
+            self._details_cache[address] = details
         self._detail_view.setPlainText(details)
 
     def show_resources_view(self):
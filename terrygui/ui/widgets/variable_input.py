@@ -5,15 +5,17 @@ Provides type-appropriate input fields for Terraform variables with
 validation feedback, description tooltips, and sensitive value masking.
 """
 
+import json
 import logging
-from typing import Any, Optional
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
 
 from PySide6.QtWidgets import (
     QWidget, QHBoxLayout, QVBoxLayout, QLabel,
     QLineEdit, QCheckBox, QTextEdit, QToolButton,
     QScrollArea, QFrame, QSizePolicy,
 )
-from PySide6.QtCore import Qt, Signal, QTimer
+from PySide6.QtCore import Qt, Signal, QTimer, QSignalBlocker
 from PySide6.QtGui import QIntValidator, QDoubleValidator
 
 from ...core.terraform_parser import TerraformVariable
@@ -25,6 +27,59 @@ _TEXT_EDIT_MIN_HEIGHT = 60
 _TEXT_EDIT_MAX_HEIGHT = 400
 
 
+# Input control kinds.  Fixed per widget from the variable's type and
+# sensitivity, so hot paths branch on an int instead of re-lowering strings.
+_KIND_STRING, _KIND_NUMBER, _KIND_BOOL, _KIND_JSON, _KIND_SENSITIVE = range(5)
+_JSON_TYPES = ("list", "map", "object", "set", "tuple")
+
+
+def _input_kind(variable: TerraformVariable) -> int:
+    """Return the input control kind used for *variable*."""
+    if variable.sensitive:
+        return _KIND_SENSITIVE
+    var_type = variable.type.lower()
+    if var_type == "bool":
+        return _KIND_BOOL
+    if var_type == "number":
+        return _KIND_NUMBER
+    if var_type in _JSON_TYPES:
+        return _KIND_JSON
+    return _KIND_STRING
+
+
+def _is_checked(value: Any) -> bool:
+    """Return whether a bool input shows *value* as checked."""
+    return value is True or str(value).lower() in ("true", "1")
+
+
+def _input_text(kind: int, value: Any) -> str:
+    """Return the text a non-bool input of *kind* shows for *value*."""
+    if kind == _KIND_JSON and not isinstance(value, str):
+        return json.dumps(value, indent=2)
+    return str(value)
+
+
+def _input_value(variable: TerraformVariable, value: Any) -> Any:
+    """Return what get_value() reads back after set_value(*value*)."""
+    kind = _input_kind(variable)
+    if kind == _KIND_BOOL:
+        return _is_checked(value)
+    if value is None:
+        return ""
+    return _input_text(kind, value).strip()
+
+
+def _validation_error(variable: TerraformVariable, value: Any) -> Optional[str]:
+    """Return why *value* is invalid for *variable*, or None if it is valid."""
+    if value is None or value == "":
+        return "Required" if variable.is_required() else None
+    try:
+        InputSanitizer.sanitize_variable_value(value, variable.type.lower())
+    except SecurityError as e:
+        return str(e)
+    return None
+
+
 class _AutoResizingTextEdit(QTextEdit):
     """QTextEdit that grows/shrinks vertically to fit its content."""
 
@@ -61,11 +116,27 @@ class VariableInputWidget(QWidget):
 
     value_changed = Signal(str)  # Emits variable name when value changes
 
+    # Typing pause before the value is re-validated
+    VALIDATE_DELAY_MS = 200
+
     def __init__(self, variable: TerraformVariable, parent: Optional[QWidget] = None):
         super().__init__(parent)
         self.variable = variable
-        self._valid = True
+        self._var_type = variable.type.lower()
+        self._kind = _input_kind(variable)
+        # Result of the last validation; None until validated or after an
+        # unvalidated change
+        self._valid: Optional[bool] = None
+        # Value at the last value_changed; edits that strip to the same
+        # value (e.g. trailing spaces) are not reported again
+        self._last_emitted_value: Any = None
         self._init_ui()
+
+        self._validate_timer = QTimer(self)
+        self._validate_timer.setSingleShot(True)
+        self._validate_timer.setInterval(self.VALIDATE_DELAY_MS)
+        self._validate_timer.timeout.connect(self._validate)
+
         self._apply_default()
 
     def _init_ui(self):
@@ -74,10 +145,7 @@ class VariableInputWidget(QWidget):
         layout.setContentsMargins(4, 2, 4, 2)
 
         # Label: variable name (with * if required)
-        label_text = self.variable.name
-        if self.variable.is_required():
-            label_text += " *"
-        self.name_label = QLabel(label_text)
+        self.name_label = QLabel(self._build_label())
         self.name_label.setFixedWidth(180)
         self.name_label.setToolTip(self._build_tooltip())
         layout.addWidget(self.name_label)
@@ -91,6 +159,13 @@ class VariableInputWidget(QWidget):
         self.validation_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self.validation_label)
 
+    def _build_label(self) -> str:
+        """Build the label text: the variable name, with * if required."""
+        label_text = self.variable.name
+        if self.variable.is_required():
+            label_text += " *"
+        return label_text
+
     def _build_tooltip(self) -> str:
         """Build a tooltip string from variable metadata."""
         parts = []
@@ -107,33 +182,29 @@ class VariableInputWidget(QWidget):
 
     def _create_input_widget(self, layout):
         """Create the appropriate input widget based on variable type."""
-        var_type = self.variable.type.lower()
-
-        if self.variable.sensitive:
+        if self._kind == _KIND_SENSITIVE:
             self._input = QLineEdit()
             self._input.setEchoMode(QLineEdit.EchoMode.Password)
             self._input.setPlaceholderText("(sensitive)")
             self._input.textChanged.connect(self._on_text_changed)
             layout.addWidget(self._input)
 
-        elif var_type == "bool":
+        elif self._kind == _KIND_BOOL:
             self._input = QCheckBox()
-            self._input.stateChanged.connect(
-                lambda: self.value_changed.emit(self.variable.name)
-            )
+            self._input.stateChanged.connect(self._on_state_changed)
             layout.addWidget(self._input)
             # Add stretch so checkbox doesn't float far right
             layout.addStretch()
 
-        elif var_type == "number":
+        elif self._kind == _KIND_NUMBER:
             self._input = QLineEdit()
             self._input.setPlaceholderText("number")
             self._input.textChanged.connect(self._on_text_changed)
             layout.addWidget(self._input)
 
-        elif var_type in ("list", "map", "object", "set", "tuple"):
+        elif self._kind == _KIND_JSON:
             self._input = _AutoResizingTextEdit()
-            self._input.setPlaceholderText(f'{var_type} (JSON format)')
+            self._input.setPlaceholderText(f'{self._var_type} (JSON format)')
             self._input.textChanged.connect(
                 lambda: self._on_text_changed(self._input.toPlainText())
             )
@@ -149,49 +220,63 @@ class VariableInputWidget(QWidget):
         """Set the input to the variable's default value if present."""
         if self.variable.default is None:
             return
+        self.set_value(self.variable.default)
 
-        default = self.variable.default
-        var_type = self.variable.type.lower()
+    def can_rebind(self, variable: TerraformVariable) -> bool:
+        """Return True if *variable* would get the same kind of input control."""
+        return (
+            variable.type.lower() == self._var_type
+            and variable.sensitive == self.variable.sensitive
+        )
 
-        if var_type == "bool":
-            checked = default is True or str(default).lower() in ("true", "1")
-            self._input.setChecked(checked)
-        elif var_type in ("list", "map", "object", "set", "tuple"):
-            import json
-            if isinstance(default, str):
-                self._input.setPlainText(default)
-            else:
-                self._input.setPlainText(json.dumps(default, indent=2))
+    def rebind(self, variable: TerraformVariable):
+        """
+        Show a re-parsed variable in this row, keeping its input control.
+
+        The input is reset to the new variable's default, as a freshly
+        constructed widget would be.  Only valid when can_rebind() is True.
+        """
+        self.variable = variable
+        self.name_label.setText(self._build_label())
+        self.name_label.setToolTip(self._build_tooltip())
+
+        # Clear silently: a new widget starts without a validation marker
+        blocker = QSignalBlocker(self._input)
+        if self._kind == _KIND_BOOL:
+            self._input.setChecked(False)
         else:
-            self._input.setText(str(default))
+            self._input.clear()
+        blocker.unblock()
+        self._set_validation_state(True)
+        self._valid = None
+        self._last_emitted_value = None
 
-    def _on_text_changed(self, text: str):
-        """Handle text changes — validate and update indicator."""
-        self._validate()
-        self.value_changed.emit(self.variable.name)
+        self._apply_default()
 
-    def _validate(self) -> bool:
-        """Validate current value and update the indicator icon."""
+    def _on_text_changed(self, text: str):
+        """Handle text changes — report the change, validate once typing pauses."""
         value = self.get_value()
-        var_type = self.variable.type.lower()
+        if value == self._last_emitted_value:
+            return
+        self._last_emitted_value = value
+        self.value_changed.emit(self.variable.name)
+        self._validate_timer.start()
 
-        # Empty required field
-        if self.variable.is_required() and (value is None or value == ""):
-            self._set_validation_state(False, "Required")
-            return False
+    def _on_state_changed(self):
+        """Handle checkbox toggles."""
+        self._valid = None
+        self.value_changed.emit(self.variable.name)
 
-        # Empty optional field is fine
-        if value is None or value == "":
-            self._set_validation_state(True)
-            return True
+    def force_revalidate(self) -> bool:
+        """Validate immediately, dropping any pending debounced validation."""
+        self._validate_timer.stop()
+        return self._validate()
 
-        try:
-            InputSanitizer.sanitize_variable_value(value, var_type)
-            self._set_validation_state(True)
-            return True
-        except SecurityError as e:
-            self._set_validation_state(False, str(e))
-            return False
+    def _validate(self) -> bool:
+        """Validate current value and update the indicator icon."""
+        error = _validation_error(self.variable, self.get_value())
+        self._set_validation_state(error is None, error or "")
+        return error is None
 
     def _set_validation_state(self, valid: bool, message: str = ""):
         """Update the validation indicator."""
@@ -206,34 +291,36 @@ class VariableInputWidget(QWidget):
 
     def get_value(self) -> Any:
         """Return the current value from the input widget."""
-        var_type = self.variable.type.lower()
-
-        if var_type == "bool":
+        if self._kind == _KIND_BOOL:
             return self._input.isChecked()
-        elif var_type in ("list", "map", "object", "set", "tuple"):
+        elif self._kind == _KIND_JSON:
             return self._input.toPlainText().strip()
         else:
             return self._input.text().strip()
 
     def set_value(self, value: Any):
         """Set the input widget value programmatically."""
-        var_type = self.variable.type.lower()
-
-        if var_type == "bool":
-            checked = value is True or str(value).lower() in ("true", "1")
-            self._input.setChecked(checked)
-        elif var_type in ("list", "map", "object", "set", "tuple"):
-            import json
-            if isinstance(value, str):
-                self._input.setPlainText(value)
-            else:
-                self._input.setPlainText(json.dumps(value, indent=2))
+        if self._kind == _KIND_BOOL:
+            self._input.setChecked(_is_checked(value))
+            return
+
+        if self._kind == _KIND_JSON:
+            self._input.setPlainText(_input_text(self._kind, value))
         else:
-            self._input.setText(str(value))
+            self._input.setText(_input_text(self._kind, value))
+        # Programmatic changes are validated straight away
+        self.force_revalidate()
 
     def is_valid(self) -> bool:
-        """Return whether the current value passes validation."""
-        return self._validate()
+        """
+        Return whether the current value passes validation.
+
+        Uses the result of the last validation; only validates when the
+        value changed since (or was never validated).
+        """
+        if self._valid is None or self._validate_timer.isActive():
+            return self.force_revalidate()
+        return self._valid
 
 
 class VariablesPanel(QWidget):
@@ -241,12 +328,32 @@ class VariablesPanel(QWidget):
     Scrollable panel containing VariableInputWidget for each variable.
 
     Manages creation, layout, value retrieval, and validation for
-    all variables in a Terraform project.
+    all variables in a Terraform project.  Rows are built in batches as
+    they are scrolled into view, so large projects open quickly; values
+    and validation cover every variable, built or not.
     """
 
+    values_loaded = Signal()  # Emitted once after load_variables() completes
+
+    # Rows built per batch (initially and each time the end is reached)
+    ROW_BATCH = 50
+
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
         self._widgets: dict[str, VariableInputWidget] = {}
+        # Kept in step with the widgets so readers don't walk every input
+        self._values: dict[str, Any] = {}
+        self._var_types: dict[str, str] = {}
+        self._sensitive: set[str] = set()
+        self._variables: list[TerraformVariable] = []
+        # Index in _variables of the next row to build
+        self._next_row = 0
+        # Variables whose row is not built yet, and values to give their
+        # rows once built
+        self._unbuilt: dict[str, TerraformVariable] = {}
+        self._pending: dict[str, Any] = {}
+        # Rows from the previous load kept for re-binding
+        self._spare: dict[str, VariableInputWidget] = {}
         self._init_ui()
 
     def _init_ui(self):
@@ -257,6 +364,9 @@ class VariablesPanel(QWidget):
         self._scroll = QScrollArea()
         self._scroll.setWidgetResizable(True)
         self._scroll.setFrameShape(QFrame.Shape.NoFrame)
+        scroll_bar = self._scroll.verticalScrollBar()
+        scroll_bar.valueChanged.connect(self._on_scrolled)
+        scroll_bar.rangeChanged.connect(self._on_scrolled)
 
         self._container = QWidget()
         self._container_layout = QVBoxLayout(self._container)
@@ -282,74 +392,154 @@ class VariablesPanel(QWidget):
             variables: List of TerraformVariable from the parser.
             saved_values: Optional dict of previously saved non-sensitive values.
         """
-        self.clear()
-
         if not variables:
+            self.clear()
             self._empty_label.setText("No variables defined")
             self._empty_label.show()
             return
 
         self._empty_label.hide()
 
-        for var in variables:
-            widget = VariableInputWidget(var)
+        # Rows for names that are still present with the same type are
+        # re-bound instead of rebuilt; only the rest are created or deleted.
+        self._spare.update(self._widgets)
+        self._widgets = {}
+        self._values.clear()
+        # A name declared twice (e.g. a block pasted mid-edit) keeps its
+        # first position and its last declaration
+        self._unbuilt = {var.name: var for var in variables}
+        self._variables = list(self._unbuilt.values())
+        self._next_row = 0
+        self._var_types = {var.name: var.type for var in self._variables}
+        self._sensitive = {var.name for var in self._variables if var.sensitive}
+
+        # Restore saved values (never for sensitive vars).  Per-widget
+        # value_changed is suppressed; listeners get values_loaded instead.
+        self._pending = {
+            name: value for name, value in (saved_values or {}).items()
+            if name in self._unbuilt and name not in self._sensitive
+        }
+
+        # Repaint once after all rows are in place rather than per insert
+        self._container.setUpdatesEnabled(False)
+        try:
+            for widget in self._spare.values():
+                self._container_layout.removeWidget(widget)
+                widget.hide()
+            self._build_rows(self.ROW_BATCH)
+            for name in [n for n in self._spare if n not in self._unbuilt]:
+                self._spare.pop(name).deleteLater()
+        finally:
+            self._container.setUpdatesEnabled(True)
+
+        for name in self._unbuilt:
+            self._store_value(name)
+
+        self._update_max_height()
+        self.values_loaded.emit()
+
+    def _build_rows(self, count: int):
+        """Build the next *count* unbuilt rows, in declaration order."""
+        start = self._next_row
+        self._next_row = min(start + count, len(self._variables))
+        for var in self._variables[start:self._next_row]:
+            widget = self._spare.pop(var.name, None)
+            if widget is not None and widget.can_rebind(var):
+                widget.rebind(var)
+            else:
+                if widget is not None:
+                    widget.deleteLater()
+                widget = VariableInputWidget(var)
+                widget.value_changed.connect(self._store_value)
+            if var.name in self._pending:
+                blocker = QSignalBlocker(widget)
+                widget.set_value(self._pending.pop(var.name))
+                blocker.unblock()
+            del self._unbuilt[var.name]
             self._widgets[var.name] = widget
             # Insert before the stretch
             self._container_layout.insertWidget(
                 self._container_layout.count() - 1, widget
             )
+            widget.show()
+            self._store_value(var.name)
 
-        # Restore saved values (never for sensitive vars)
-        if saved_values:
-            for name, value in saved_values.items():
-                if name in self._widgets and not self._widgets[name].variable.sensitive:
-                    self._widgets[name].set_value(value)
+        if not self._unbuilt:
+            for widget in self._spare.values():
+                widget.deleteLater()
+            self._spare.clear()
 
-        self._update_max_height()
+    def _on_scrolled(self, *_args):
+        """Build another batch of rows once the end of the list is in view."""
+        if not self._unbuilt:
+            return
+        scroll_bar = self._scroll.verticalScrollBar()
+        if scroll_bar.value() >= scroll_bar.maximum() - scroll_bar.pageStep():
+            self._container.setUpdatesEnabled(False)
+            try:
+                self._build_rows(self.ROW_BATCH)
+            finally:
+                self._container.setUpdatesEnabled(True)
+
+    def _store_value(self, name: str):
+        """Refresh the cached value for one variable from its widget."""
+        widget = self._widgets.get(name)
+        if widget is not None:
+            val = widget.get_value()
+        elif name in self._unbuilt:
+            var = self._unbuilt[name]
+            val = _input_value(var, self._pending.get(name, var.default))
+        else:
+            return
+        if val is not None and val != "":
+            self._values[name] = val
+        else:
+            self._values.pop(name, None)
 
     def _update_max_height(self):
         """Set maximum height to fit content without excess empty space."""
-        if len(self._widgets) == 0:
+        if len(self._variables) == 0:
             self.setMaximumHeight(60)
         else:
             self.setMaximumHeight(16777215)  # Qt default (no cap)
 
     def clear(self):
         """Remove all variable input widgets."""
-        for widget in self._widgets.values():
+        self._spare.update(self._widgets)
+        for widget in self._spare.values():
             self._container_layout.removeWidget(widget)
             widget.deleteLater()
+        self._spare.clear()
         self._widgets.clear()
+        self._values.clear()
+        self._var_types = {}
+        self._sensitive = set()
+        self._variables = []
+        self._next_row = 0
+        self._unbuilt = {}
+        self._pending = {}
         self._empty_label.setText("No project loaded")
         self._empty_label.show()
         self._update_max_height()
 
     def get_all_values(self) -> dict[str, Any]:
         """Return a dict of variable name -> current value for non-empty fields."""
-        values = {}
-        for name, widget in self._widgets.items():
-            val = widget.get_value()
-            if val is not None and val != "":
-                values[name] = val
-        return values
+        return dict(self._values)
 
-    def get_var_types(self) -> dict[str, str]:
-        """Return a dict of variable name -> type string."""
-        return {name: w.variable.type for name, w in self._widgets.items()}
+    def get_var_types(self) -> Mapping[str, str]:
+        """Return a read-only mapping of variable name -> type string."""
+        return MappingProxyType(self._var_types)
 
     def get_non_sensitive_values(self) -> dict[str, Any]:
         """Return values for non-sensitive variables only (safe to persist)."""
-        values = {}
-        for name, widget in self._widgets.items():
-            if not widget.variable.sensitive:
-                val = widget.get_value()
-                if val is not None and val != "":
-                    values[name] = val
-        return values
+        return {
+            name: val for name, val in self._values.items()
+            if name not in self._sensitive
+        }
 
     def get_sensitive_names(self) -> set[str]:
         """Return the set of variable names that are marked sensitive."""
-        return {name for name, w in self._widgets.items() if w.variable.sensitive}
+        return set(self._sensitive)
 
     def set_values(self, values: dict) -> int:
         """
@@ -365,9 +555,17 @@ class VariablesPanel(QWidget):
         for name, value in values.items():
             if name in self._widgets:
                 self._widgets[name].set_value(value)
-                count += 1
+            elif name in self._unbuilt:
+                self._pending[name] = value
+                self._store_value(name)
+            else:
+                continue
+            count += 1
         return count
 
     def all_valid(self) -> bool:
         """Return True if all variable inputs pass validation."""
-        return all(w.is_valid() for w in self._widgets.values())
+        return all(w.is_valid() for w in self._widgets.values()) and all(
+            _validation_error(var, self._values.get(name)) is None
+            for name, var in self._unbuilt.items()
+        )
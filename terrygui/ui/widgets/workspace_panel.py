@@ -72,12 +72,16 @@ class WorkspacePanelWidget(QWidget):
         self._refreshing = True
         try:
             workspaces = self._manager.list_workspaces()
-            self._combo.clear()
-            current_index = 0
-            for i, ws in enumerate(workspaces):
-                self._combo.addItem(ws.name)
-                if ws.is_current:
-                    current_index = i
+            names = [ws.name for ws in workspaces]
+            current_index = next(
+                (i for i, ws in enumerate(workspaces) if ws.is_current), 0
+            )
+
+            # Only rebuild the dropdown when the set of workspaces changed
+            existing = [self._combo.itemText(i) for i in range(self._combo.count())]
+            if names != existing:
+                self._combo.clear()
+                self._combo.addItems(names)
             self._combo.setCurrentIndex(current_index)
 
             # Can't delete the "default" workspace or current workspace
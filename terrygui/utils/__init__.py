@@ -5,15 +5,17 @@ Utility functions for TerryGUI.
 import subprocess
 import sys
 
+# Fixed for the process; defined before the submodule imports so they can
+# import it at module level
+_CREATION_FLAGS = subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
+
 from .logger import setup_logging
 from .validators import validate_terraform_installed
 
 
 def subprocess_creation_flags() -> int:
     """Return creationflags to hide console windows on Windows, 0 elsewhere."""
-    if sys.platform == "win32":
-        return subprocess.CREATE_NO_WINDOW
-    return 0
+    return _CREATION_FLAGS
 
 
 __all__ = ["setup_logging", "validate_terraform_installed", "subprocess_creation_flags"]
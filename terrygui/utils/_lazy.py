@@ -0,0 +1,30 @@
+"""
+Lazy attribute loading for packages (PEP 562).
+"""
+
+import importlib
+import sys
+from typing import Any, Callable, Dict
+
+
+def make_lazy_getattr(package: str, mapping: Dict[str, str]) -> Callable[[str], Any]:
+    """
+    Build a module ``__getattr__`` that imports names on first access.
+    
+    Args:
+        package: ``__name__`` of the package the hook is installed in
+        mapping: Attribute name -> relative module that defines it
+        
+    Returns:
+        Function to assign to the package's ``__getattr__``
+    """
+    def __getattr__(name: str) -> Any:
+        if name in mapping:
+            module = importlib.import_module(mapping[name], package)
+            value = getattr(module, name)
+            # Cache on the package so later lookups skip this hook
+            setattr(sys.modules[package], name, value)
+            return value
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+    
+    return __getattr__
@@ -2,10 +2,57 @@
 Logging configuration for TerryGUI.
 """
 
+import functools
 import logging
+import logging.handlers
+import os
 import sys
 from pathlib import Path
-from datetime import datetime
+
+# Records buffered before the log file is written; ERROR and above (and
+# logging.shutdown() at exit) flush straight away
+LOG_BUFFER_CAPACITY = 512
+
+# One log file, rotated, instead of a new file per run
+LOG_FILE_NAME = "terrygui.log"
+LOG_MAX_BYTES = 5 * 1024 * 1024
+LOG_BACKUP_COUNT = 5
+
+# Level names accepted by setup_logging(); anything else falls back to INFO
+_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
+# Formatters are stateless, so every setup_logging() call shares them
+_CONSOLE_FORMATTER = logging.Formatter('%(levelname)s: %(message)s')
+_FILE_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
+
+# Handlers added by the last setup_logging() call, closed by the next one
+_installed_handlers: list = []
+
+
+class _LazyFileHandler(logging.handlers.RotatingFileHandler):
+    """Rotating handler that creates the log directory and file on first write."""
+
+    def __init__(self, filename: Path):
+        super().__init__(
+            filename,
+            maxBytes=LOG_MAX_BYTES,
+            backupCount=LOG_BACKUP_COUNT,
+            encoding="utf-8",
+            delay=True,
+        )
+
+    def _open(self):
+        Path(self.baseFilename).parent.mkdir(parents=True, exist_ok=True)
+        return super()._open()
 
 
 def setup_logging(log_level: str = "INFO", log_file: bool = True) -> logging.Logger:
@@ -19,52 +66,67 @@ def setup_logging(log_level: str = "INFO", log_file: bool = True) -> logging.Log
     Returns:
         Root logger instance
     """
-    # Create logger
+    # Neither format shows thread, process or call-site details, so skip
+    # collecting them for every record
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    logging._srcfile = None
+    
+    # Create logger.  Its level is raised to the lowest handler level, so
+    # records no handler would accept are dropped before they are built.
     logger = logging.getLogger()
-    logger.setLevel(getattr(logging, log_level.upper(), logging.INFO))
+    handler_level = logging.DEBUG if log_file else logging.INFO
+    logger.setLevel(max(_LEVELS.get(log_level.upper(), logging.INFO), handler_level))
     
-    # Clear any existing handlers
+    # Clear any existing handlers.  Ours are closed first: that flushes
+    # records still held in the file buffer and closes the log file.
+    for handler in _installed_handlers:
+        target = getattr(handler, "target", None)
+        handler.close()
+        if target is not None:
+            target.close()
+    _installed_handlers.clear()
     logger.handlers.clear()
     
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.INFO)
-    console_formatter = logging.Formatter(
-        '%(levelname)s: %(message)s'
-    )
-    console_handler.setFormatter(console_formatter)
+    console_handler.setFormatter(_CONSOLE_FORMATTER)
     logger.addHandler(console_handler)
+    _installed_handlers.append(console_handler)
     
     # File handler (if requested)
     if log_file:
-        log_dir = get_log_dir()
-        log_dir.mkdir(parents=True, exist_ok=True)
+        log_file_path = get_log_dir() / LOG_FILE_NAME
         
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        log_file_path = log_dir / f"terrygui_{timestamp}.log"
-        
-        file_handler = logging.FileHandler(log_file_path)
-        file_handler.setLevel(logging.DEBUG)
-        file_formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        # Nothing touches the disk until the buffer first flushes
+        file_handler = _LazyFileHandler(log_file_path)
+        file_handler.setFormatter(_FILE_FORMATTER)
+        buffered_handler = logging.handlers.MemoryHandler(
+            LOG_BUFFER_CAPACITY,
+            flushLevel=logging.ERROR,
+            target=file_handler,
         )
-        file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
+        buffered_handler.setLevel(logging.DEBUG)
+        logger.addHandler(buffered_handler)
+        _installed_handlers.append(buffered_handler)
         
         logger.info(f"Logging to file: {log_file_path}")
     
     return logger
 
 
+@functools.cache
 def get_log_dir() -> Path:
     """
     Get platform-specific log directory.
     
+    Resolved once per process; the environment it reads does not change.
+    
     Returns:
         Path to log directory
     """
-    import os
-    
     if os.name == 'nt':  # Windows
         base = os.environ.get('LOCALAPPDATA', os.path.expanduser('~'))
         log_dir = Path(base) / 'terrygui' / 'logs'
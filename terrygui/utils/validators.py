@@ -2,48 +2,148 @@
 Validation utilities for TerryGUI.
 """
 
+import os
 import shutil
 import subprocess
-from typing import Tuple, Optional
+from typing import TYPE_CHECKING, Dict, Tuple, Optional
 
+from . import _CREATION_FLAGS
 
-def validate_terraform_installed(terraform_binary: str = "terraform") -> Tuple[bool, Optional[str]]:
+if TYPE_CHECKING:
+    from ..config import Settings
+
+
+def validate_terraform_installed(terraform_binary: str = "terraform",
+                                 settings: Optional["Settings"] = None) -> Tuple[bool, Optional[str]]:
     """
     Check if Terraform is installed and accessible.
     
+    A successful result is cached per resolved binary and its mtime, so
+    ``terraform version`` is spawned once per binary and again after it is
+    replaced; use ``validate_terraform_installed.cache_clear()`` to check
+    again regardless.  Failures are not cached, so a terraform installed or
+    fixed while the app runs is found on the next check.  With *settings*,
+    the version is also remembered across runs on the same terms.
+    
     Args:
         terraform_binary: Path or name of terraform binary
+        settings: Optional Settings holding the persisted probe result
         
     Returns:
         Tuple of (is_installed, version_string)
         If not installed, version_string is None
     """
-    # Check if binary exists in PATH
-    if not shutil.which(terraform_binary):
+    found = _resolve_binary(terraform_binary)
+    if found is None:
         return False, None
     
-    # Try to get version
+    if settings is not None:
+        known = _persisted_probe(found, settings)
+        if known is not None:
+            return known
+    
+    is_installed, version = _validate_terraform_cached(found)
+    if is_installed and settings is not None:
+        _persist_probe(found, version, settings)
+    return is_installed, version
+
+
+def _resolve_binary(terraform_binary: str) -> Optional[Tuple[str, float]]:
+    """Return the resolved path and mtime of *terraform_binary*, or None if missing."""
+    resolved = shutil.which(terraform_binary)
+    if not resolved:
+        return None
+    try:
+        return resolved, os.stat(resolved).st_mtime
+    except OSError:
+        return None
+
+
+def probe_terraform_from_settings(terraform_binary: str,
+                                  settings: "Settings") -> Optional[Tuple[bool, Optional[str]]]:
+    """
+    Answer the Terraform check without spawning a process, when possible.
+    
+    Returns:
+        (False, None) if the binary is not found, (True, version) if the
+        probe persisted in *settings* is for the unchanged binary, or None
+        if ``terraform version`` has to be run.
+    """
+    found = _resolve_binary(terraform_binary)
+    if found is None:
+        return False, None
+    return _persisted_probe(found, settings)
+
+
+def remember_terraform_probe(terraform_binary: str, version: Optional[str],
+                             settings: "Settings"):
+    """Persist *version* in *settings* for the binary as it is now."""
+    found = _resolve_binary(terraform_binary)
+    if found is not None:
+        _persist_probe(found, version, settings)
+
+
+def _persisted_probe(found: Tuple[str, float],
+                     settings: "Settings") -> Optional[Tuple[bool, Optional[str]]]:
+    resolved, mtime = found
+    probe = settings.get("terraform_probe_cache")
+    if (isinstance(probe, dict) and probe.get("path") == resolved
+            and probe.get("mtime") == mtime):
+        return True, probe.get("version")
+    return None
+
+
+def _persist_probe(found: Tuple[str, float], version: Optional[str],
+                   settings: "Settings"):
+    resolved, mtime = found
+    settings.set("terraform_probe_cache", {
+        "path": resolved, "mtime": mtime, "version": version,
+    })
+
+
+# Successful probes only: (resolved path, mtime) -> (True, version).  The
+# mtime in the key means a binary upgraded in place is probed again.
+_probe_cache: Dict[Tuple[str, float], Tuple[bool, Optional[str]]] = {}
+
+
+def _validate_terraform_cached(found: Tuple[str, float]) -> Tuple[bool, Optional[str]]:
+    cached = _probe_cache.get(found)
+    if cached is not None:
+        return cached
+    
+    result = _run_terraform_version(found[0])
+    if result[0]:
+        _probe_cache[found] = result
+    return result
+
+
+def _run_terraform_version(resolved: str) -> Tuple[bool, Optional[str]]:
+    # Run the resolved path, so the version belongs to the binary whose
+    # mtime keys the cache
     try:
-        from . import subprocess_creation_flags
         result = subprocess.run(
-            [terraform_binary, "version"],
-            capture_output=True,
-            text=True,
+            [resolved, "version"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             timeout=5,
-            creationflags=subprocess_creation_flags(),
+            creationflags=_CREATION_FLAGS,
         )
         
-        if result.returncode == 0:
-            # Parse version from output (first line usually contains version)
-            version_line = result.stdout.split('\n')[0]
-            return True, version_line
-        else:
+        # A zero exit with no output is not a terraform binary either
+        if result.returncode != 0 or not result.stdout:
             return False, None
+        
+        # Parse version from output (first line usually contains version)
+        version_line = result.stdout.split(b'\n', 1)[0]
+        return True, version_line.decode('utf-8', 'replace').rstrip('\r')
     
     except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
         return False, None
 
 
+validate_terraform_installed.cache_clear = _probe_cache.clear
+
+
 def validate_project_is_terraform(project_path: str) -> bool:
     """
     Check if a directory appears to be a Terraform project.
@@ -56,15 +156,13 @@ def validate_project_is_terraform(project_path: str) -> bool:
     Returns:
         True if appears to be a Terraform project
     """
-    import os
-    from pathlib import Path
-    
-    path = Path(project_path)
-    
-    if not path.exists() or not path.is_dir():
+    # The first .tf entry settles it; a missing path or non-directory
+    # fails the scandir itself, so no separate exists/is_dir stat is needed
+    try:
+        with os.scandir(project_path) as entries:
+            return any(
+                entry.name.endswith(".tf") and entry.is_file()
+                for entry in entries
+            )
+    except OSError:
         return False
-    
-    # Look for .tf files
-    tf_files = list(path.glob("*.tf"))
-    
-    return len(tf_files) > 0
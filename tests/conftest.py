@@ -4,6 +4,16 @@ import pytest
 from unittest.mock import MagicMock
 
 
+@pytest.fixture(scope="session", autouse=True)
+def isolated_config_dir(tmp_path_factory):
+    """Point Settings at a temporary config dir, so no test reads or writes the user's."""
+    config_home = tmp_path_factory.mktemp("config")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("XDG_CONFIG_HOME", str(config_home))
+        mp.setenv("APPDATA", str(config_home))
+        yield config_home
+
+
 @pytest.fixture
 def mock_settings():
     """Return a minimal Settings-like mock suitable for constructing ProjectPane."""
@@ -13,3 +23,41 @@ def mock_settings():
     settings.get_last_project.return_value = None
     settings.get_recent_projects.return_value = []
     return settings
+
+
+@pytest.fixture(scope="session")
+def tf_project(tmp_path_factory):
+    """Return a temporary directory holding a main.tf, created once per session."""
+    project = tmp_path_factory.mktemp("tf_proj")
+    (project / "main.tf").write_text('variable "example" {}')
+    return str(project)
+
+
+@pytest.fixture(scope="class")
+def mgr(request, tf_project):
+    """One terraform manager per test class, of the class's ``manager_class``.
+
+    The managers hold only their project path and binary, so one instance
+    serves every test in the class.
+    """
+    return request.cls.manager_class(tf_project, terraform_binary="terraform")
+
+
+@pytest.fixture(scope="class")
+def shared_widget(qapp):
+    """Return a getter for widgets built once per test class.
+
+    ``shared_widget(WidgetClass)`` constructs the widget on first use and
+    returns the same instance for the rest of the class; module fixtures
+    reset whatever state their tests touch.
+    """
+    widgets = {}
+
+    def get(widget_class):
+        if widget_class not in widgets:
+            widgets[widget_class] = widget_class()
+        return widgets[widget_class]
+
+    yield get
+    for widget in widgets.values():
+        widget.deleteLater()
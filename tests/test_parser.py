@@ -9,16 +9,27 @@ from pathlib import Path
 from terrygui.core import TerraformParser, TerraformVariable
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def simple_project_path():
     """Path to simple test fixture."""
     return os.path.join(os.path.dirname(__file__), "fixtures", "simple")
 
 
-def test_parser_finds_variables(simple_project_path):
+@pytest.fixture(scope="session")
+def parsed_variables(simple_project_path):
+    """Variables of the simple fixture, parsed once for the whole session."""
+    return TerraformParser(simple_project_path).parse_variables()
+
+
+@pytest.fixture(scope="session")
+def variables_by_name(parsed_variables):
+    """The parsed simple-fixture variables keyed by name."""
+    return {v.name: v for v in parsed_variables}
+
+
+def test_parser_finds_variables(parsed_variables):
     """Test that parser finds all variables in simple project."""
-    parser = TerraformParser(simple_project_path)
-    variables = parser.parse_variables()
+    variables = parsed_variables
 
     assert len(variables) == 5
     var_names = [v.name for v in variables]
@@ -29,56 +40,30 @@ def test_parser_finds_variables(simple_project_path):
     assert "vpc_id" in var_names
 
 
-def test_parser_detects_sensitive(simple_project_path):
-    """Test that parser correctly identifies sensitive variables."""
-    parser = TerraformParser(simple_project_path)
-    variables = parser.parse_variables()
-    
-    api_key_var = next((v for v in variables if v.name == "api_key"), None)
-    assert api_key_var is not None
-    assert api_key_var.sensitive is True
-
-
-def test_parser_detects_required(simple_project_path):
-    """Test that parser identifies required variables (no default)."""
-    parser = TerraformParser(simple_project_path)
-    variables = parser.parse_variables()
-    
-    api_key_var = next((v for v in variables if v.name == "api_key"), None)
-    assert api_key_var is not None
-    assert api_key_var.is_required() is True
-    
-    region_var = next((v for v in variables if v.name == "region"), None)
-    assert region_var is not None
-    assert region_var.is_required() is False
-
-
-def test_parser_extracts_defaults(simple_project_path):
-    """Test that parser extracts default values."""
-    parser = TerraformParser(simple_project_path)
-    variables = parser.parse_variables()
-    
-    region_var = next((v for v in variables if v.name == "region"), None)
-    assert region_var is not None
-    assert region_var.default == "us-east-1"
-    
-    enable_monitoring_var = next((v for v in variables if v.name == "enable_monitoring"), None)
-    assert enable_monitoring_var is not None
-    assert enable_monitoring_var.default is False
-
-
-def test_parser_extracts_types(simple_project_path):
-    """Test that parser extracts variable types."""
-    parser = TerraformParser(simple_project_path)
-    variables = parser.parse_variables()
-    
-    region_var = next((v for v in variables if v.name == "region"), None)
-    assert region_var is not None
-    assert "string" in region_var.type
-    
-    enable_monitoring_var = next((v for v in variables if v.name == "enable_monitoring"), None)
-    assert enable_monitoring_var is not None
-    assert "bool" in enable_monitoring_var.type
+@pytest.mark.parametrize("name, attr, expected", [
+    # Sensitivity
+    ("api_key", "sensitive", True),
+    ("region", "sensitive", False),
+    # Required means no default at all
+    ("api_key", "is_required", True),
+    ("region", "is_required", False),
+    # Defaults
+    ("region", "default", "us-east-1"),
+    ("enable_monitoring", "default", False),
+    # Types
+    ("region", "type", "string"),
+    ("enable_monitoring", "type", "bool"),
+    # default = null is optional, not required
+    ("vpc_id", "has_default", True),
+    ("vpc_id", "default", None),
+    ("vpc_id", "is_required", False),
+])
+def test_parser_variable_attributes(variables_by_name, name, attr, expected):
+    """Test the attributes the parser extracts from each variable block."""
+    value = getattr(variables_by_name[name], attr)
+    if callable(value):
+        value = value()
+    assert value == expected
 
 
 def test_parser_handles_empty_directory(tmp_path):
@@ -89,16 +74,25 @@ def test_parser_handles_empty_directory(tmp_path):
     assert len(variables) == 0
 
 
-def test_parser_null_default_is_not_required(simple_project_path):
-    """Variables with default = null are optional, not required."""
-    parser = TerraformParser(simple_project_path)
-    variables = parser.parse_variables()
+def test_parser_reuses_cache_when_files_unchanged(tmp_path):
+    """Unchanged .tf files are not re-parsed."""
+    (tmp_path / "main.tf").write_text('variable "region" {}\n')
+    parser = TerraformParser(str(tmp_path))
+
+    first = parser.parse_variables()
+    assert parser.parse_variables() is first
+
+
+def test_parser_reparses_when_file_changes(tmp_path):
+    """Editing a .tf file invalidates the cached variables."""
+    tf_file = tmp_path / "main.tf"
+    tf_file.write_text('variable "region" {}\n')
+    parser = TerraformParser(str(tmp_path))
+    assert [v.name for v in parser.parse_variables()] == ["region"]
 
-    vpc_id_var = next((v for v in variables if v.name == "vpc_id"), None)
-    assert vpc_id_var is not None
-    assert vpc_id_var.has_default is True
-    assert vpc_id_var.default is None
-    assert vpc_id_var.is_required() is False
+    tf_file.write_text('variable "region" {}\nvariable "zone" {}\n')
+    names = {v.name for v in parser.parse_variables()}
+    assert names == {"region", "zone"}
 
 
 def test_parser_syntax_validation(simple_project_path):
@@ -22,6 +22,49 @@ except ImportError:
 needs_qt = pytest.mark.skipif(not _HAS_QT, reason="PySide6 not available")
 
 
+@pytest.fixture(scope="module")
+def settings(tmp_path_factory):
+    """One Settings, saving to a temp file, shared by a module's dialog tests."""
+    from terrygui.config import Settings
+
+    settings = Settings()
+    settings.config_file = tmp_path_factory.mktemp("cfg") / "settings.json"
+    return settings
+
+
+@pytest.fixture(scope="module")
+def main_window(qapp, tmp_path_factory):
+    """One MainWindow shared by a module's tests; each test resets what it uses.
+
+    Its settings save to a temp file, and the terraform probe is faked for the
+    window's whole life: the result arrives asynchronously and must not be
+    remembered into any settings.
+    """
+    from terrygui.ui.main_window import MainWindow
+
+    with patch("terrygui.ui.main_window.probe_terraform_from_settings", return_value=None), \
+         patch("terrygui.ui.main_window.validate_terraform_installed", return_value=(True, "1.0")), \
+         patch("terrygui.ui.main_window.remember_terraform_probe"):
+        window = MainWindow()
+        window.settings.config_file = tmp_path_factory.mktemp("cfg") / "settings.json"
+        yield window
+        window.close()
+        window.deleteLater()
+
+
+@pytest.fixture(scope="module")
+def project_pane(qapp):
+    """One ProjectPane, with default-returning settings, shared by a module's tests."""
+    from terrygui.ui.widgets.project_pane import ProjectPane
+
+    settings = MagicMock()
+    settings.get.side_effect = lambda key, default=None: default
+    pane = ProjectPane(settings)
+    yield pane
+    pane.close()
+    pane.deleteLater()
+
+
 # ---------------------------------------------------------------------------
 # TfvarsHandler tests
 # ---------------------------------------------------------------------------
@@ -117,11 +160,9 @@ class TestSettingsDialog:
     """Tests for SettingsDialog."""
 
     @needs_qt
-    def test_loads_current_values(self, qtbot, tmp_path):
-        from terrygui.config import Settings
+    def test_loads_current_values(self, qtbot, settings):
         from terrygui.ui.dialogs.settings_dialog import SettingsDialog
 
-        settings = Settings()
         settings.set("editor_command", "vim")
         settings.set("terraform_binary", "/usr/local/bin/terraform")
         settings.set("confirmations.apply", False)
@@ -134,13 +175,9 @@ class TestSettingsDialog:
         assert dialog.confirm_apply.isChecked() is False
 
     @needs_qt
-    def test_save_persists_changes(self, qtbot, tmp_path):
-        from terrygui.config import Settings
+    def test_save_persists_changes(self, qtbot, settings):
         from terrygui.ui.dialogs.settings_dialog import SettingsDialog
 
-        settings = Settings()
-        settings.config_file = tmp_path / "settings.json"
-
         dialog = SettingsDialog(settings)
         qtbot.addWidget(dialog)
 
@@ -154,11 +191,9 @@ class TestSettingsDialog:
         assert settings.get("confirmations.apply") is False
 
     @needs_qt
-    def test_cancel_does_not_persist(self, qtbot):
-        from terrygui.config import Settings
+    def test_cancel_does_not_persist(self, qtbot, settings):
         from terrygui.ui.dialogs.settings_dialog import SettingsDialog
 
-        settings = Settings()
         original_editor = settings.get("editor_command", "code")
 
         dialog = SettingsDialog(settings)
@@ -170,13 +205,9 @@ class TestSettingsDialog:
         assert settings.get("editor_command", "code") == original_editor
 
     @needs_qt
-    def test_empty_editor_defaults_to_code(self, qtbot, tmp_path):
-        from terrygui.config import Settings
+    def test_empty_editor_defaults_to_code(self, qtbot, settings):
         from terrygui.ui.dialogs.settings_dialog import SettingsDialog
 
-        settings = Settings()
-        settings.config_file = tmp_path / "settings.json"
-
         dialog = SettingsDialog(settings)
         qtbot.addWidget(dialog)
 
@@ -187,58 +218,274 @@ class TestSettingsDialog:
 
 
 # ---------------------------------------------------------------------------
-# Recent Projects tests
+# Settings persistence tests
 # ---------------------------------------------------------------------------
 
-class TestRecentProjects:
-    """Tests for recent projects menu behavior."""
+class TestSettingsFlush:
+    """Tests for deferred Settings persistence."""
+
+    def test_flush_skips_write_when_clean(self, tmp_path):
+        from terrygui.config import Settings
+
+        settings = Settings()
+        settings.config_file = tmp_path / "settings.json"
+        settings.flush()
+
+        assert not settings.config_file.exists()
+
+    def test_flush_writes_after_set(self, tmp_path):
+        from terrygui.config import Settings
+
+        settings = Settings()
+        settings.config_file = tmp_path / "settings.json"
+        settings.set("editor_command", "vim")
+        assert settings.is_dirty()
+
+        settings.flush()
+
+        assert not settings.is_dirty()
+        assert json.loads(settings.config_file.read_text())["editor_command"] == "vim"
+
+    def test_save_replaces_file_atomically(self, tmp_path):
+        from terrygui.config import Settings
+
+        settings = Settings()
+        settings.config_file = tmp_path / "settings.json"
+        settings.set("editor_command", "vim")
+        settings.save()
+
+        settings.set("editor_command", object())
+        with pytest.raises(TypeError):
+            settings.save()
+
+        # The previous file is intact and no temporary files are left over
+        assert json.loads(settings.config_file.read_text())["editor_command"] == "vim"
+        assert [p.name for p in tmp_path.iterdir()] == ["settings.json"]
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX permission bits")
+    def test_save_keeps_existing_file_mode(self, tmp_path):
+        from terrygui.config import Settings
+
+        settings = Settings()
+        settings.config_file = tmp_path / "settings.json"
+        settings.save()
+        assert settings.config_file.stat().st_mode & 0o777 == 0o600
+
+        settings.config_file.chmod(0o644)
+        settings.set("editor_command", "vim")
+        settings.save()
+        assert settings.config_file.stat().st_mode & 0o777 == 0o644
+
+    @pytest.mark.skipif(os.name == "nt", reason="symlinks need privileges on Windows")
+    def test_save_keeps_symlinked_file(self, tmp_path):
+        from terrygui.config import Settings
+
+        dotfiles = tmp_path / "dotfiles"
+        dotfiles.mkdir()
+        real_file = dotfiles / "settings.json"
+        real_file.write_text("{}")
+        link = tmp_path / "settings.json"
+        link.symlink_to(real_file)
+
+        settings = Settings()
+        settings.config_file = link
+        settings.set("editor_command", "vim")
+        settings.save()
+
+        assert link.is_symlink()
+        assert json.loads(real_file.read_text())["editor_command"] == "vim"
+        assert sorted(p.name for p in dotfiles.iterdir()) == ["settings.json"]
+
+
+# ---------------------------------------------------------------------------
+# Validator tests
+# ---------------------------------------------------------------------------
+
+class TestValidateTerraformInstalled:
+    def test_result_cached_per_binary(self, tmp_path):
+        from terrygui.utils import validate_terraform_installed
+        binary = tmp_path / "tf"
+        binary.write_text("")
+        validate_terraform_installed.cache_clear()
+        try:
+            with patch("terrygui.utils.validators.shutil.which", return_value=str(binary)), \
+                 patch("terrygui.utils.validators.subprocess.run") as run:
+                run.return_value = MagicMock(returncode=0, stdout=b"Terraform v1.6.0\r\non linux_amd64\n")
+                assert validate_terraform_installed("tf") == (True, "Terraform v1.6.0")
+                assert validate_terraform_installed("tf") == (True, "Terraform v1.6.0")
+                assert run.call_count == 1
+
+                validate_terraform_installed.cache_clear()
+                validate_terraform_installed("tf")
+                assert run.call_count == 2
+
+                # Failures are re-checked on every call
+                validate_terraform_installed.cache_clear()
+                run.return_value = MagicMock(returncode=1, stdout=b"")
+                assert validate_terraform_installed("tf") == (False, None)
+                run.return_value = MagicMock(returncode=0, stdout=b"Terraform v1.7.0\n")
+                assert validate_terraform_installed("tf") == (True, "Terraform v1.7.0")
+                assert run.call_count == 4
+
+                # A binary upgraded in place is probed again
+                os.utime(binary, (0, 0))
+                run.return_value = MagicMock(returncode=0, stdout=b"Terraform v1.9.0\n")
+                assert validate_terraform_installed("tf") == (True, "Terraform v1.9.0")
+                assert run.call_args[0][0] == [str(binary), "version"]
+        finally:
+            validate_terraform_installed.cache_clear()
+
+    def test_probe_persisted_in_settings(self, tmp_path):
+        from terrygui.config import Settings
+        from terrygui.utils import validate_terraform_installed
+        binary = tmp_path / "terraform"
+        binary.write_text("")
+        settings = Settings()
+        settings.config_file = tmp_path / "settings.json"
+        validate_terraform_installed.cache_clear()
+        try:
+            with patch("terrygui.utils.validators.shutil.which", return_value=str(binary)), \
+                 patch("terrygui.utils.validators.subprocess.run") as run:
+                run.return_value = MagicMock(returncode=0, stdout=b"Terraform v1.6.0\r\non linux_amd64\n")
+                assert validate_terraform_installed("terraform", settings)[0]
+                assert settings.get("terraform_probe_cache")["version"] == "Terraform v1.6.0"
+
+                # A later run with the same binary reuses the stored probe
+                validate_terraform_installed.cache_clear()
+                assert validate_terraform_installed("terraform", settings) == \
+                    (True, "Terraform v1.6.0")
+                assert run.call_count == 1
+
+                # A binary replaced while running is probed again, and the
+                # new version is what gets stored
+                os.utime(binary, (0, 0))
+                run.return_value = MagicMock(returncode=0, stdout=b"Terraform v1.9.0\n")
+                assert validate_terraform_installed("terraform", settings) == \
+                    (True, "Terraform v1.9.0")
+                assert run.call_count == 2
+                assert settings.get("terraform_probe_cache") == {
+                    "path": str(binary), "mtime": 0, "version": "Terraform v1.9.0",
+                }
+        finally:
+            validate_terraform_installed.cache_clear()
+
 
     @needs_qt
-    def test_empty_menu_shows_placeholder(self, qtbot):
+    def test_main_window_probes_off_gui_thread(self, qtbot, tmp_path):
+        import threading
         from terrygui.ui.main_window import MainWindow
 
-        with patch("terrygui.ui.main_window.validate_terraform_installed", return_value=(True, "1.0")):
+        probe_threads = []
+
+        def probe(binary):
+            probe_threads.append(threading.current_thread())
+            return False, None
+
+        with patch("terrygui.ui.main_window.probe_terraform_from_settings", return_value=None), \
+             patch("terrygui.ui.main_window.validate_terraform_installed", side_effect=probe), \
+             patch("terrygui.ui.main_window.remember_terraform_probe") as remember:
             window = MainWindow()
+            window.settings.config_file = tmp_path / "settings.json"
             qtbot.addWidget(window)
 
-        window.settings.set("recent_projects", [])
-        window._rebuild_recent_menu()
+            qtbot.waitUntil(
+                lambda: "not found" in window.status_bar.currentMessage()
+            )
+        assert probe_threads and probe_threads[0] is not threading.main_thread()
+        remember.assert_not_called()
+
+
+class TestValidateProjectIsTerraform:
+    def test_detects_tf_files(self, tmp_path):
+        from terrygui.utils.validators import validate_project_is_terraform
+        assert not validate_project_is_terraform(str(tmp_path))
+        (tmp_path / "notes.txt").write_text("")
+        (tmp_path / "modules.tf").mkdir()
+        assert not validate_project_is_terraform(str(tmp_path))
+        (tmp_path / "main.tf").write_text("")
+        assert validate_project_is_terraform(str(tmp_path))
+
+    def test_missing_or_file_path(self, tmp_path):
+        from terrygui.utils.validators import validate_project_is_terraform
+        assert not validate_project_is_terraform(str(tmp_path / "missing"))
+        (tmp_path / "main.tf").write_text("")
+        assert not validate_project_is_terraform(str(tmp_path / "main.tf"))
+
+
+# ---------------------------------------------------------------------------
+# Logging tests
+# ---------------------------------------------------------------------------
+
+class TestSetupLogging:
+    def test_repeat_setup_flushes_buffered_records(self, tmp_path):
+        import logging
+        from terrygui.utils import logger as logger_module
+
+        root = logging.getLogger()
+        saved_handlers, saved_level = root.handlers[:], root.level
+        try:
+            with patch.object(logger_module, "get_log_dir", return_value=tmp_path):
+                logger_module.setup_logging("DEBUG")
+                logging.getLogger("terrygui.test").info("buffered record")
+                log_file = tmp_path / logger_module.LOG_FILE_NAME
+                assert not log_file.exists()
 
-        actions = window._recent_menu.actions()
+                logger_module.setup_logging("DEBUG", log_file=False)
+            assert "buffered record" in log_file.read_text(encoding="utf-8")
+        finally:
+            logger_module.setup_logging("INFO", log_file=False)
+            root.handlers[:] = saved_handlers
+            root.setLevel(saved_level)
+
+
+# ---------------------------------------------------------------------------
+# Recent Projects tests
+# ---------------------------------------------------------------------------
+
+class TestRecentProjects:
+    """Tests for recent projects menu behavior."""
+
+    @needs_qt
+    def test_empty_menu_shows_placeholder(self, main_window):
+        main_window.settings.set("recent_projects", [])
+        main_window._rebuild_recent_menu()
+
+        actions = main_window._recent_menu.actions()
         assert len(actions) == 1
         assert not actions[0].isEnabled()
         assert "No recent" in actions[0].text()
 
     @needs_qt
-    def test_populated_menu_has_items(self, qtbot, tmp_path):
-        from terrygui.ui.main_window import MainWindow
-
-        with patch("terrygui.ui.main_window.validate_terraform_installed", return_value=(True, "1.0")):
-            window = MainWindow()
-            qtbot.addWidget(window)
-
+    def test_populated_menu_has_items(self, main_window, tmp_path):
         paths = [str(tmp_path / "proj1"), str(tmp_path / "proj2")]
-        window.settings.set("recent_projects", paths)
-        window._rebuild_recent_menu()
+        main_window.settings.set("recent_projects", paths)
+        main_window._rebuild_recent_menu()
 
-        actions = window._recent_menu.actions()
+        actions = main_window._recent_menu.actions()
         # 2 project items + separator + clear action = 4
         assert len(actions) == 4
         assert actions[0].text() == paths[0]
         assert actions[1].text() == paths[1]
 
     @needs_qt
-    def test_clear_empties_list(self, qtbot):
-        from terrygui.ui.main_window import MainWindow
+    def test_rebuild_reuses_pooled_actions(self, main_window, tmp_path):
+        main_window.settings.set("recent_projects", [str(tmp_path / "a")])
+        main_window._rebuild_recent_menu()
+        first = main_window._recent_menu.actions()[0]
 
-        with patch("terrygui.ui.main_window.validate_terraform_installed", return_value=(True, "1.0")):
-            window = MainWindow()
-            qtbot.addWidget(window)
+        main_window.settings.set("recent_projects", [str(tmp_path / "b")])
+        main_window._rebuild_recent_menu()
+        second = main_window._recent_menu.actions()[0]
+
+        assert first is second
+        assert second.data() == str(tmp_path / "b")
 
-        window.settings.set("recent_projects", ["/some/path"])
-        window._clear_recent_projects()
+    @needs_qt
+    def test_clear_empties_list(self, main_window):
+        main_window.settings.set("recent_projects", ["/some/path"])
+        main_window._clear_recent_projects()
 
-        assert window.settings.get_recent_projects() == []
+        assert main_window.settings.get_recent_projects() == []
 
 
 # ---------------------------------------------------------------------------
@@ -249,40 +496,16 @@ class TestKeyboardShortcuts:
     """Tests for button keyboard shortcuts."""
 
     @needs_qt
-    def test_init_button_shortcut(self, qtbot):
-        from terrygui.ui.widgets.project_pane import ProjectPane
-        from unittest.mock import MagicMock
-
-        settings = MagicMock()
-        settings.get.side_effect = lambda key, default=None: default
-        pane = ProjectPane(settings)
-        qtbot.addWidget(pane)
-
-        assert pane.init_button.shortcut().toString() == "Ctrl+I"
+    def test_init_button_shortcut(self, project_pane):
+        assert project_pane.init_button.shortcut().toString() == "Ctrl+I"
 
     @needs_qt
-    def test_plan_button_shortcut(self, qtbot):
-        from terrygui.ui.widgets.project_pane import ProjectPane
-        from unittest.mock import MagicMock
-
-        settings = MagicMock()
-        settings.get.side_effect = lambda key, default=None: default
-        pane = ProjectPane(settings)
-        qtbot.addWidget(pane)
-
-        assert pane.plan_button.shortcut().toString() == "Ctrl+P"
+    def test_plan_button_shortcut(self, project_pane):
+        assert project_pane.plan_button.shortcut().toString() == "Ctrl+P"
 
     @needs_qt
-    def test_apply_button_shortcut(self, qtbot):
-        from terrygui.ui.widgets.project_pane import ProjectPane
-        from unittest.mock import MagicMock
-
-        settings = MagicMock()
-        settings.get.side_effect = lambda key, default=None: default
-        pane = ProjectPane(settings)
-        qtbot.addWidget(pane)
-
-        assert pane.apply_button.shortcut().toString() == "Ctrl+Shift+A"
+    def test_apply_button_shortcut(self, project_pane):
+        assert project_pane.apply_button.shortcut().toString() == "Ctrl+Shift+A"
 
 
 # ---------------------------------------------------------------------------
@@ -83,3 +83,244 @@ class TestProjectPane:
 
         # Should not raise
         pane.save_state()
+
+    @needs_qt
+    def test_edit_project_prefers_editor_on_path(self, qtbot, mock_settings):
+        """VS Code is launched directly when `code` is on PATH."""
+        from terrygui.ui.widgets.project_pane import ProjectPane
+
+        pane = ProjectPane(mock_settings)
+        qtbot.addWidget(pane)
+        pane.current_project_path = "/home/user/infra"
+
+        with patch("terrygui.ui.widgets.project_pane.shutil.which",
+                   return_value="/usr/bin/code"), \
+             patch("terrygui.ui.widgets.project_pane.QDesktopServices.openUrl") as mock_open, \
+             patch("terrygui.ui.widgets.project_pane.subprocess.Popen") as mock_popen:
+            pane.on_edit_project()
+
+        mock_open.assert_not_called()
+        assert mock_popen.call_args[0][0] == ["code", "/home/user/infra"]
+
+    @needs_qt
+    def test_edit_project_uses_url_handler_when_not_on_path(self, qtbot, mock_settings):
+        """Without `code` on PATH, VS Code is opened through its vscode:// URL handler."""
+        from terrygui.ui.widgets.project_pane import ProjectPane
+
+        pane = ProjectPane(mock_settings)
+        qtbot.addWidget(pane)
+        pane.current_project_path = "/home/user/infra"
+
+        with patch("terrygui.ui.widgets.project_pane.shutil.which", return_value=None), \
+             patch("terrygui.ui.widgets.project_pane.QDesktopServices.openUrl",
+                   return_value=True) as mock_open, \
+             patch("terrygui.ui.widgets.project_pane.subprocess.Popen") as mock_popen:
+            pane.on_edit_project()
+
+        url = mock_open.call_args[0][0]
+        assert url.toString() == "vscode://file/home/user/infra"
+        mock_popen.assert_not_called()
+
+    @needs_qt
+    def test_edit_project_falls_back_to_subprocess(self, qtbot, mock_settings):
+        """Editors without a URL handler are still launched via subprocess."""
+        from terrygui.ui.widgets.project_pane import ProjectPane
+
+        mock_settings.get.side_effect = (
+            lambda key, default=None: "vim" if key == "editor_command" else default
+        )
+        pane = ProjectPane(mock_settings)
+        qtbot.addWidget(pane)
+        pane.current_project_path = "/home/user/infra"
+
+        with patch("terrygui.ui.widgets.project_pane.QDesktopServices.openUrl") as mock_open, \
+             patch("terrygui.ui.widgets.project_pane.subprocess.Popen") as mock_popen:
+            pane.on_edit_project()
+
+        mock_open.assert_not_called()
+        assert mock_popen.call_args[0][0] == ["vim", "/home/user/infra"]
+
+    @needs_qt
+    def test_state_dialog_reused_after_close(self, qtbot, mock_settings):
+        """The state dialog is built once and survives being closed."""
+        from unittest.mock import MagicMock
+        from terrygui.ui.widgets.project_pane import ProjectPane
+
+        pane = ProjectPane(mock_settings)
+        qtbot.addWidget(pane)
+        pane.state_manager = MagicMock()
+        pane.state_manager.list_resources.return_value = []
+
+        first = pane._get_or_create_state_dialog()
+        first.close()
+        second = pane._get_or_create_state_dialog()
+
+        assert second is first
+        assert pane._state_viewer.manager() is pane.state_manager
+        assert pane.state_manager.list_resources.call_count == 1
+
+    @needs_qt
+    def test_operations_reuse_worker_thread(self, qtbot, mock_settings):
+        """Consecutive operations run on the same persistent worker thread."""
+        from unittest.mock import MagicMock
+        from terrygui.core import CommandResult
+        from terrygui.ui.widgets.project_pane import ProjectPane
+
+        pane = ProjectPane(mock_settings)
+        qtbot.addWidget(pane)
+        pane.terraform_runner = MagicMock()
+        pane.terraform_runner.init.return_value = CommandResult(0, "", "", True, "init")
+        pane.terraform_runner.validate.return_value = CommandResult(0, "", "", True, "validate")
+
+        pane._run_operation("init")
+        qtbot.waitUntil(lambda: not pane.is_operation_running())
+        thread = pane._worker_thread
+
+        pane._run_operation("validate")
+        qtbot.waitUntil(lambda: not pane.is_operation_running())
+
+        assert pane._worker_thread is thread
+        assert pane._init_done is True
+        pane.terraform_runner.validate.assert_called_once()
+
+        pane.shutdown()
+        assert pane._worker_thread is None
+
+    @needs_qt
+    def test_worker_coalesces_output_lines(self, qtbot):
+        """Streamed lines are emitted as one chunk rather than one signal each."""
+        from unittest.mock import MagicMock
+        from terrygui.core import CommandResult
+        from terrygui.ui.widgets.project_pane import _OperationWorker
+
+        def fake_init(output_callback):
+            for line in ("a", "b", "c"):
+                output_callback(line)
+            return CommandResult(0, "", "", True, "init")
+
+        runner = MagicMock()
+        runner.init.side_effect = fake_init
+        worker = _OperationWorker()
+        chunks = []
+        worker.line_output.connect(chunks.append)
+
+        worker.invoke(runner, "init", None, None, False)
+
+        assert chunks == ["a\nb\nc"]
+
+    @needs_qt
+    def test_failure_stderr_appended_only_when_not_streamed(self, qtbot, mock_settings):
+        """Runner stderr is already in the viewer; synthesised errors are not."""
+        from terrygui.core import CommandResult
+        from terrygui.ui.widgets.project_pane import ProjectPane
+
+        pane = ProjectPane(mock_settings)
+        qtbot.addWidget(pane)
+
+        pane._on_operation_finished(
+            CommandResult(1, "", "streamed error", False, "plan"), True
+        )
+        assert "streamed error" not in pane.output_viewer.get_text()
+
+        pane._on_operation_finished(
+            CommandResult(1, "", "worker error", False, "plan"), False
+        )
+        assert "worker error" in pane.output_viewer.get_text()
+
+    @needs_qt
+    def test_watcher_reloads_only_for_tf_changes(self, qtbot, tmp_path, mock_settings):
+        """Terraform's own writes are ignored; .tf changes wait for a running operation."""
+        from unittest.mock import MagicMock
+        from terrygui.core import CommandResult
+        from terrygui.ui.widgets.project_pane import ProjectPane
+
+        (tmp_path / "main.tf").write_text("")
+        pane = ProjectPane(mock_settings)
+        qtbot.addWidget(pane)
+        pane.current_project_path = str(tmp_path)
+        pane.terraform_parser = MagicMock()
+        pane.terraform_parser.parse_variables.return_value = []
+        pane._watch_project_files()
+
+        (tmp_path / ".terraform.lock.hcl").write_text("")
+        pane._on_project_files_changed(str(tmp_path))
+        assert not pane._vars_dirty
+        assert not pane._fs_refresh_timer.isActive()
+
+        pane._running = True
+        (tmp_path / "vars.tf").write_text("")
+        pane._on_project_files_changed(str(tmp_path))
+        assert pane._vars_dirty
+        assert not pane._fs_refresh_timer.isActive()
+
+        pane._on_operation_finished(CommandResult(0, "", "", True, "plan"))
+        assert pane._fs_refresh_timer.isActive()
+        pane._fs_refresh_timer.stop()
+        pane._on_project_files_settled()
+        pane.terraform_parser.parse_variables.assert_called_once()
+        assert pane._vars_dirty is False
+
+    @needs_qt
+    def test_watcher_reload_keeps_sensitive_values(self, qtbot, tmp_path, mock_settings):
+        """A file save does not drop secrets whose variable is unchanged."""
+        from unittest.mock import MagicMock
+        from terrygui.core.terraform_parser import TerraformVariable
+        from terrygui.ui.widgets.project_pane import ProjectPane
+
+        pane = ProjectPane(mock_settings)
+        qtbot.addWidget(pane)
+        pane.current_project_path = str(tmp_path)
+        variables = [
+            TerraformVariable(name="r", type="string"),
+            TerraformVariable(name="token", type="string", sensitive=True),
+            TerraformVariable(name="key", type="string", sensitive=True),
+        ]
+        pane.terraform_parser = MagicMock()
+        pane.terraform_parser.parse_variables.return_value = variables
+        pane.variables_panel.load_variables(variables)
+        pane.variables_panel.set_values({"r": "x", "token": "s3cret", "key": "k"})
+
+        # "key" is no longer sensitive, so its value is not carried over
+        variables[2] = TerraformVariable(name="key", type="string")
+        pane._on_project_files_settled()
+
+        assert pane.variables_panel.get_all_values() == {"r": "x", "token": "s3cret"}
+
+    @needs_qt
+    def test_manual_refresh_always_reparses(self, qtbot, tmp_path, mock_settings):
+        """Refresh re-parses even when the watcher reported nothing."""
+        from unittest.mock import MagicMock
+        from terrygui.ui.widgets.project_pane import ProjectPane
+
+        pane = ProjectPane(mock_settings)
+        qtbot.addWidget(pane)
+        pane.current_project_path = str(tmp_path)
+        pane.terraform_parser = MagicMock()
+        pane.terraform_parser.parse_variables.return_value = []
+
+        pane._on_refresh_project()
+        pane.terraform_parser.parse_variables.assert_called_once()
+
+    @needs_qt
+    def test_reload_reuses_runner_and_debug_toggle(self, qtbot, tmp_path, mock_settings):
+        """Reloading a project keeps its runner; the debug box updates it in place."""
+        from terrygui.ui.widgets.project_pane import ProjectPane
+
+        (tmp_path / "main.tf").write_text('variable "region" {}')
+        pane = ProjectPane(mock_settings)
+        qtbot.addWidget(pane)
+
+        with patch("terrygui.ui.widgets.project_pane.InputSanitizer.sanitize_path",
+                   return_value=str(tmp_path)), \
+             patch("terrygui.ui.widgets.project_pane.TerraformRunner") as runner_cls, \
+             patch("terrygui.ui.widgets.project_pane.WorkspaceManager"), \
+             patch("terrygui.ui.widgets.project_pane.StateManager"):
+            pane.load_project(str(tmp_path))
+            runner = pane.terraform_runner
+            pane.load_project(str(tmp_path))
+
+        assert runner_cls.call_count == 1
+        assert pane.terraform_runner is runner
+
+        pane.debug_checkbox.setChecked(True)
+        assert runner.debug is True
@@ -8,36 +8,31 @@ import pytest
 from terrygui.security import InputSanitizer, SecurityError
 
 
-def test_sanitize_variable_name_valid():
+@pytest.mark.parametrize("name", [
+    "region",
+    "instance_type",
+    "aws_access_key",
+    "_private_key",
+    "var-with-hyphens",
+    "MixedCase123",
+])
+def test_sanitize_variable_name_valid(name):
     """Test valid variable names are accepted."""
-    valid_names = [
-        "region",
-        "instance_type",
-        "aws_access_key",
-        "_private_key",
-        "var-with-hyphens",
-        "MixedCase123",
-    ]
-    
-    for name in valid_names:
-        result = InputSanitizer.sanitize_variable_name(name)
-        assert result == name
-
-
-def test_sanitize_variable_name_invalid():
+    assert InputSanitizer.sanitize_variable_name(name) == name
+
+
+@pytest.mark.parametrize("name", [
+    "",  # Empty
+    "123invalid",  # Starts with digit
+    "has spaces",  # Contains spaces
+    "has@symbol",  # Invalid character
+    "has.dot",  # Invalid character
+    "-starts-with-hyphen",  # Starts with hyphen
+])
+def test_sanitize_variable_name_invalid(name):
     """Test invalid variable names raise SecurityError."""
-    invalid_names = [
-        "",  # Empty
-        "123invalid",  # Starts with digit
-        "has spaces",  # Contains spaces
-        "has@symbol",  # Invalid character
-        "has.dot",  # Invalid character
-        "-starts-with-hyphen",  # Starts with hyphen
-    ]
-    
-    for name in invalid_names:
-        with pytest.raises(SecurityError):
-            InputSanitizer.sanitize_variable_name(name)
+    with pytest.raises(SecurityError):
+        InputSanitizer.sanitize_variable_name(name)
 
 
 def test_sanitize_variable_name_too_long():
@@ -48,84 +43,75 @@ def test_sanitize_variable_name_too_long():
         InputSanitizer.sanitize_variable_name(long_name)
 
 
-def test_sanitize_variable_value_blocks_shell_chars():
+@pytest.mark.parametrize("value", [
+    "value;rm -rf /",
+    "value|cat /etc/passwd",
+    "value&background_task",
+    "value`whoami`",
+    "value$HOME",
+    "value\\escape",
+])
+def test_sanitize_variable_value_blocks_shell_chars(value):
     """Test that shell metacharacters are blocked."""
-    dangerous_values = [
-        "value;rm -rf /",
-        "value|cat /etc/passwd",
-        "value&background_task",
-        "value`whoami`",
-        "value$HOME",
-        "value\\escape",
-    ]
-    
-    for value in dangerous_values:
-        with pytest.raises(SecurityError):
-            InputSanitizer.sanitize_variable_value(value, "string")
-
-
-def test_sanitize_variable_value_allows_safe_chars():
+    with pytest.raises(SecurityError):
+        InputSanitizer.sanitize_variable_value(value, "string")
+
+
+@pytest.mark.parametrize("value", [
+    "us-east-1",
+    "t3.micro",
+    "192.168.1.1",
+    "/path/to/file",
+    "value:with:colons",
+    "key=value",
+])
+def test_sanitize_variable_value_allows_safe_chars(value):
     """Test that safe characters are allowed."""
-    safe_values = [
-        "us-east-1",
-        "t3.micro",
-        "192.168.1.1",
-        "/path/to/file",
-        "value:with:colons",
-        "key=value",
-    ]
-    
-    for value in safe_values:
-        result = InputSanitizer.sanitize_variable_value(value, "string")
-        assert result == value
+    assert InputSanitizer.sanitize_variable_value(value, "string") == value
 
 
-def test_sanitize_variable_value_bool():
-    """Test boolean value sanitization."""
-    assert InputSanitizer.sanitize_variable_value(True, "bool") == "true"
-    assert InputSanitizer.sanitize_variable_value(False, "bool") == "false"
-    assert InputSanitizer.sanitize_variable_value("true", "bool") == "true"
-    assert InputSanitizer.sanitize_variable_value("false", "bool") == "false"
+@pytest.mark.parametrize("value, var_type, expected", [
+    (True, "bool", "true"),
+    (False, "bool", "false"),
+    ("true", "bool", "true"),
+    ("false", "bool", "false"),
+    (42, "number", "42"),
+    (3.14, "number", "3.14"),
+    ("123", "number", "123"),
+])
+def test_sanitize_variable_value_typed(value, var_type, expected):
+    """Test bool and number value sanitization."""
+    assert InputSanitizer.sanitize_variable_value(value, var_type) == expected
 
 
-def test_sanitize_variable_value_number():
-    """Test number value sanitization."""
-    assert InputSanitizer.sanitize_variable_value(42, "number") == "42"
-    assert InputSanitizer.sanitize_variable_value(3.14, "number") == "3.14"
-    assert InputSanitizer.sanitize_variable_value("123", "number") == "123"
-    
+def test_sanitize_variable_value_number_invalid():
+    """Test that non-numeric values are rejected for number variables."""
     with pytest.raises(SecurityError):
         InputSanitizer.sanitize_variable_value("not_a_number", "number")
 
 
-def test_sanitize_workspace_name_valid():
+@pytest.mark.parametrize("name", [
+    "default",
+    "production",
+    "dev-environment",
+    "test_workspace",
+    "env123",
+])
+def test_sanitize_workspace_name_valid(name):
     """Test valid workspace names."""
-    valid_names = [
-        "default",
-        "production",
-        "dev-environment",
-        "test_workspace",
-        "env123",
-    ]
-    
-    for name in valid_names:
-        result = InputSanitizer.sanitize_workspace_name(name)
-        assert result == name
+    assert InputSanitizer.sanitize_workspace_name(name) == name
 
 
-def test_sanitize_workspace_name_invalid():
+@pytest.mark.parametrize("name", [
+    "",
+    "-starts-with-hyphen",
+    "has spaces",
+    "has@symbol",
+])
+def test_sanitize_workspace_name_invalid(name):
     """Test invalid workspace names."""
     with pytest.raises(SecurityError):
-        InputSanitizer.sanitize_workspace_name("")
-    
-    with pytest.raises(SecurityError):
-        InputSanitizer.sanitize_workspace_name("-starts-with-hyphen")
-    
-    with pytest.raises(SecurityError):
-        InputSanitizer.sanitize_workspace_name("has spaces")
-    
-    with pytest.raises(SecurityError):
-        InputSanitizer.sanitize_workspace_name("has@symbol")
+        InputSanitizer.sanitize_workspace_name(name)
 
 
 def test_sanitize_path_requires_existing():
@@ -143,11 +129,16 @@ def test_sanitize_path_requires_directory(tmp_path):
         InputSanitizer.sanitize_path(str(test_file))
 
 
-def test_sanitize_path_allows_home_directory():
+def test_sanitize_path_allows_home_directory(tmp_path, monkeypatch):
     """Test that paths in home directory are allowed."""
-    home_dir = os.path.expanduser("~")
-    result = InputSanitizer.sanitize_path(home_dir)
+    home_dir = str(tmp_path.resolve())
+    monkeypatch.setenv("HOME", home_dir)
+    monkeypatch.setenv("USERPROFILE", home_dir)
+    (tmp_path / "project").mkdir()
+
+    result = InputSanitizer.sanitize_path("~/project")
     assert os.path.isabs(result)
+    assert result == os.path.join(home_dir, "project")
 
 
 def test_is_safe_command_arg():
@@ -4,8 +4,10 @@ Tests for StateManager and StateViewerWidget.
 All tests mock subprocess so no real Terraform installation is needed.
 """
 
+import subprocess
+
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 from terrygui.core.state_manager import StateManager, StateResource, StateSummary
 from terrygui.security.sanitizer import SecurityError
@@ -20,6 +22,11 @@ except ImportError:
 needs_qt = pytest.mark.skipif(not _HAS_QT, reason="PySide6 not available")
 
 
+def _cp(stdout="", stderr="", rc=0):
+    """Return a finished subprocess.run() result carrying the given output."""
+    return subprocess.CompletedProcess([], rc, stdout, stderr)
+
+
 # ---------------------------------------------------------------------------
 # StateManager tests (pure logic, mock subprocess)
 # ---------------------------------------------------------------------------
@@ -27,18 +34,17 @@ needs_qt = pytest.mark.skipif(not _HAS_QT, reason="PySide6 not available")
 class TestStateManager:
     """Tests for StateManager command construction and parsing."""
 
-    def _make_manager(self, tmp_path):
-        (tmp_path / "main.tf").write_text("")
-        return StateManager(str(tmp_path), terraform_binary="terraform")
-
-    @patch("terrygui.core.state_manager.subprocess.run")
-    def test_list_resources_parses_output(self, mock_run, tmp_path):
-        mock_run.return_value = MagicMock(
-            returncode=0,
-            stdout="aws_instance.web\naws_s3_bucket.data\naws_iam_role.lambda_role\n",
-            stderr="",
-        )
-        mgr = self._make_manager(tmp_path)
+    manager_class = StateManager
+
+    @pytest.fixture(autouse=True)
+    def mock_run(self, monkeypatch):
+        """Stub subprocess.run for every test; tests set return_value as needed."""
+        run = MagicMock(return_value=_cp())
+        monkeypatch.setattr("terrygui.core.state_manager.subprocess.run", run)
+        return run
+
+    def test_list_resources_parses_output(self, mock_run, mgr):
+        mock_run.return_value = _cp(stdout="aws_instance.web\naws_s3_bucket.data\naws_iam_role.lambda_role\n")
         result = mgr.list_resources()
 
         assert len(result) == 3
@@ -52,32 +58,17 @@ class TestStateManager:
         assert result[2].type == "aws_iam_role"
         assert result[2].name == "lambda_role"
 
-    @patch("terrygui.core.state_manager.subprocess.run")
-    def test_list_resources_empty_state(self, mock_run, tmp_path):
-        mock_run.return_value = MagicMock(
-            returncode=0, stdout="", stderr=""
-        )
-        mgr = self._make_manager(tmp_path)
+    def test_list_resources_empty_state(self, mock_run, mgr):
         result = mgr.list_resources()
         assert result == []
 
-    @patch("terrygui.core.state_manager.subprocess.run")
-    def test_list_resources_error(self, mock_run, tmp_path):
-        mock_run.return_value = MagicMock(
-            returncode=1, stdout="", stderr="No state file found"
-        )
-        mgr = self._make_manager(tmp_path)
+    def test_list_resources_error(self, mock_run, mgr):
+        mock_run.return_value = _cp(stderr="No state file found", rc=1)
         result = mgr.list_resources()
         assert result == []
 
-    @patch("terrygui.core.state_manager.subprocess.run")
-    def test_list_resources_with_modules(self, mock_run, tmp_path):
-        mock_run.return_value = MagicMock(
-            returncode=0,
-            stdout="module.vpc.aws_vpc.main\naws_instance.web\n",
-            stderr="",
-        )
-        mgr = self._make_manager(tmp_path)
+    def test_list_resources_with_modules(self, mock_run, mgr):
+        mock_run.return_value = _cp(stdout="module.vpc.aws_vpc.main\naws_instance.web\n")
         result = mgr.list_resources()
 
         assert len(result) == 2
@@ -85,13 +76,9 @@ class TestStateManager:
         assert result[0].type == "aws_vpc"
         assert result[0].name == "main"
 
-    @patch("terrygui.core.state_manager.subprocess.run")
-    def test_get_resource_details(self, mock_run, tmp_path):
+    def test_get_resource_details(self, mock_run, mgr):
         detail_output = '# aws_instance.web:\nresource "aws_instance" "web" {\n    ami = "ami-123"\n}\n'
-        mock_run.return_value = MagicMock(
-            returncode=0, stdout=detail_output, stderr=""
-        )
-        mgr = self._make_manager(tmp_path)
+        mock_run.return_value = _cp(stdout=detail_output)
         result = mgr.get_resource_details("aws_instance.web")
 
         assert "aws_instance" in result
@@ -100,23 +87,13 @@ class TestStateManager:
         assert "show" in cmd
         assert "aws_instance.web" in cmd
 
-    @patch("terrygui.core.state_manager.subprocess.run")
-    def test_get_resource_details_error(self, mock_run, tmp_path):
-        mock_run.return_value = MagicMock(
-            returncode=1, stdout="", stderr="not found"
-        )
-        mgr = self._make_manager(tmp_path)
+    def test_get_resource_details_error(self, mock_run, mgr):
+        mock_run.return_value = _cp(stderr="not found", rc=1)
         result = mgr.get_resource_details("aws_instance.web")
         assert "Error" in result
 
-    @patch("terrygui.core.state_manager.subprocess.run")
-    def test_get_outputs(self, mock_run, tmp_path):
-        mock_run.return_value = MagicMock(
-            returncode=0,
-            stdout='vpc_id = "vpc-abc123"\nregion = "us-east-1"\n',
-            stderr="",
-        )
-        mgr = self._make_manager(tmp_path)
+    def test_get_outputs(self, mock_run, mgr):
+        mock_run.return_value = _cp(stdout='vpc_id = "vpc-abc123"\nregion = "us-east-1"\n')
         result = mgr.get_outputs()
 
         assert "vpc_id" in result
@@ -124,66 +101,44 @@ class TestStateManager:
         assert "output" in cmd
         assert "-no-color" in cmd
 
-    @patch("terrygui.core.state_manager.subprocess.run")
-    def test_get_outputs_error(self, mock_run, tmp_path):
-        mock_run.return_value = MagicMock(
-            returncode=1, stdout="", stderr="no outputs"
-        )
-        mgr = self._make_manager(tmp_path)
+    def test_get_outputs_error(self, mock_run, mgr):
+        mock_run.return_value = _cp(stderr="no outputs", rc=1)
         result = mgr.get_outputs()
         assert "Error" in result
 
-    def test_resource_address_validation_rejects_unsafe(self, tmp_path):
-        mgr = self._make_manager(tmp_path)
+    def test_resource_address_validation_rejects_unsafe(self, mgr):
         with pytest.raises(SecurityError):
             mgr.get_resource_details("$(whoami)")
 
-    def test_resource_address_validation_rejects_semicolons(self, tmp_path):
-        mgr = self._make_manager(tmp_path)
+    def test_resource_address_validation_rejects_semicolons(self, mgr):
         with pytest.raises(SecurityError):
             mgr.get_resource_details("foo; rm -rf /")
 
-    def test_resource_address_validation_rejects_empty(self, tmp_path):
-        mgr = self._make_manager(tmp_path)
+    def test_resource_address_validation_rejects_empty(self, mgr):
         with pytest.raises(SecurityError):
             mgr.get_resource_details("")
 
-    @patch("terrygui.core.state_manager.subprocess.run")
-    def test_shell_false_always(self, mock_run, tmp_path):
-        mock_run.return_value = MagicMock(
-            returncode=0, stdout="", stderr=""
-        )
-        mgr = self._make_manager(tmp_path)
+    def test_shell_false_always(self, mock_run, mgr):
         mgr.list_resources()
 
         kwargs = mock_run.call_args[1]
         assert kwargs.get("shell") is False
 
-    @patch("terrygui.core.state_manager.subprocess.run")
-    def test_chdir_flag_used(self, mock_run, tmp_path):
-        mock_run.return_value = MagicMock(
-            returncode=0, stdout="", stderr=""
-        )
-        mgr = self._make_manager(tmp_path)
+    def test_chdir_flag_used(self, mock_run, mgr):
         mgr.list_resources()
 
         cmd = mock_run.call_args[0][0]
         assert any(arg.startswith("-chdir=") for arg in cmd)
 
-    @patch("terrygui.core.state_manager.subprocess.run")
-    def test_timeout_returns_empty(self, mock_run, tmp_path):
-        import subprocess
+    def test_timeout_returns_empty(self, mock_run, mgr):
         mock_run.side_effect = subprocess.TimeoutExpired(cmd="terraform", timeout=15)
-        mgr = self._make_manager(tmp_path)
         result = mgr.list_resources()
         assert result == []
 
-    def test_parse_address_simple(self, tmp_path):
-        mgr = self._make_manager(tmp_path)
+    def test_parse_address_simple(self, mgr):
         assert mgr._parse_address("aws_instance.web") == ("aws_instance", "web")
 
-    def test_parse_address_module(self, tmp_path):
-        mgr = self._make_manager(tmp_path)
+    def test_parse_address_module(self, mgr):
         assert mgr._parse_address("module.vpc.aws_vpc.main") == ("aws_vpc", "main")
 
 
@@ -191,84 +146,97 @@ class TestStateManager:
 # StateViewerWidget tests (Qt)
 # ---------------------------------------------------------------------------
 
+@pytest.fixture
+def state_viewer(shared_widget):
+    """The class's shared StateViewerWidget, reset to its freshly constructed state."""
+    from terrygui.ui.widgets.state_viewer import StateViewerWidget
+    viewer = shared_widget(StateViewerWidget)
+    viewer._manager = None
+    viewer._resources_button.setChecked(True)
+    viewer._on_view_toggled(0)
+    return viewer
+
+
 class TestStateViewerWidget:
     """Tests for the state viewer widget."""
 
     @needs_qt
-    def test_starts_empty(self, qtbot):
-        from terrygui.ui.widgets.state_viewer import StateViewerWidget
-        viewer = StateViewerWidget()
-        qtbot.addWidget(viewer)
-
-        assert viewer._resource_list.count() == 0
-        assert viewer._detail_view.toPlainText() == ""
-        assert viewer._count_label.text() == "State Resources"
+    def test_starts_empty(self, state_viewer):
+        assert state_viewer._resource_model.rowCount() == 0
+        assert state_viewer._detail_view.toPlainText() == ""
+        assert state_viewer._count_label.text() == "State Resources"
 
     @needs_qt
-    def test_load_resources(self, qtbot):
-        from terrygui.ui.widgets.state_viewer import StateViewerWidget
-        viewer = StateViewerWidget()
-        qtbot.addWidget(viewer)
-
+    def test_load_resources(self, state_viewer):
         mock_mgr = MagicMock()
         mock_mgr.list_resources.return_value = [
             StateResource("aws_instance.web", "aws_instance", "web", ""),
             StateResource("aws_s3_bucket.data", "aws_s3_bucket", "data", ""),
         ]
 
-        viewer.set_manager(mock_mgr)
+        state_viewer.set_manager(mock_mgr)
 
-        assert viewer._resource_list.count() == 2
-        assert viewer._resource_list.item(0).text() == "aws_instance.web"
-        assert viewer._resource_list.item(1).text() == "aws_s3_bucket.data"
-        assert "2" in viewer._count_label.text()
+        assert state_viewer._resource_model.rowCount() == 2
+        assert state_viewer._resource_model.stringList()[0] == "aws_instance.web"
+        assert state_viewer._resource_model.stringList()[1] == "aws_s3_bucket.data"
+        assert "2" in state_viewer._count_label.text()
 
     @needs_qt
-    def test_select_resource_shows_details(self, qtbot):
-        from terrygui.ui.widgets.state_viewer import StateViewerWidget
-        viewer = StateViewerWidget()
-        qtbot.addWidget(viewer)
-
+    def test_select_resource_shows_details(self, state_viewer):
         mock_mgr = MagicMock()
         mock_mgr.list_resources.return_value = [
             StateResource("aws_instance.web", "aws_instance", "web", ""),
         ]
         mock_mgr.get_resource_details.return_value = 'resource "aws_instance" "web" {\n  ami = "ami-123"\n}'
 
-        viewer.set_manager(mock_mgr)
-        viewer._resource_list.setCurrentRow(0)
+        state_viewer.set_manager(mock_mgr)
+        state_viewer._resource_list.setCurrentIndex(state_viewer._resource_model.index(0))
 
         mock_mgr.get_resource_details.assert_called_once_with("aws_instance.web")
-        assert "ami-123" in viewer._detail_view.toPlainText()
+        assert "ami-123" in state_viewer._detail_view.toPlainText()
 
     @needs_qt
-    def test_outputs_view(self, qtbot):
-        from terrygui.ui.widgets.state_viewer import StateViewerWidget
-        viewer = StateViewerWidget()
-        qtbot.addWidget(viewer)
+    def test_reselecting_resource_reuses_details(self, state_viewer):
+        mock_mgr = MagicMock()
+        mock_mgr.list_resources.return_value = [
+            StateResource("aws_instance.web", "aws_instance", "web", ""),
+            StateResource("aws_instance.db", "aws_instance", "db", ""),
+        ]
+        mock_mgr.get_resource_details.side_effect = lambda address: f"details of {address}"
+
+        state_viewer.set_manager(mock_mgr)
+        state_viewer._resource_list.setCurrentIndex(state_viewer._resource_model.index(0))
+        state_viewer._resource_list.setCurrentIndex(state_viewer._resource_model.index(1))
+        state_viewer._resource_list.setCurrentIndex(state_viewer._resource_model.index(0))
 
+        assert mock_mgr.get_resource_details.call_count == 2
+        assert state_viewer._detail_view.toPlainText() == "details of aws_instance.web"
+
+        # Refresh drops the cached details
+        state_viewer._on_refresh()
+        state_viewer._resource_list.setCurrentIndex(state_viewer._resource_model.index(0))
+        assert mock_mgr.get_resource_details.call_count == 3
+
+    @needs_qt
+    def test_outputs_view(self, state_viewer):
         mock_mgr = MagicMock()
         mock_mgr.list_resources.return_value = []
         mock_mgr.get_outputs.return_value = 'vpc_id = "vpc-123"'
 
-        viewer.set_manager(mock_mgr)
-        viewer._on_view_toggled(1)
+        state_viewer.set_manager(mock_mgr)
+        state_viewer._on_view_toggled(1)
 
-        assert "vpc-123" in viewer._detail_view.toPlainText()
+        assert "vpc-123" in state_viewer._detail_view.toPlainText()
 
     @needs_qt
-    def test_refresh_reloads(self, qtbot):
-        from terrygui.ui.widgets.state_viewer import StateViewerWidget
-        viewer = StateViewerWidget()
-        qtbot.addWidget(viewer)
-
+    def test_refresh_reloads(self, state_viewer):
         mock_mgr = MagicMock()
         mock_mgr.list_resources.return_value = [
             StateResource("aws_instance.web", "aws_instance", "web", ""),
         ]
 
-        viewer.set_manager(mock_mgr)
+        state_viewer.set_manager(mock_mgr)
         assert mock_mgr.list_resources.call_count == 1
 
-        viewer._on_refresh()
+        state_viewer._on_refresh()
         assert mock_mgr.list_resources.call_count == 2
@@ -1,23 +1,52 @@
 """Tests for Phase 2 UI widgets (VariableInputWidget, OutputViewerWidget).
 
-These tests use pytest-qt where Qt is available, and pure unit tests otherwise.
+Every test here needs Qt via pytest-qt; the module is skipped when PySide6
+(or its Qt system libraries) cannot be imported.
 All tests are designed to work without a running Terraform installation.
 """
 
 import pytest
 from unittest.mock import MagicMock, patch
 
+pytest.importorskip("PySide6.QtWidgets", reason="PySide6 not available")
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QFont, QTextCursor
+from PySide6.QtWidgets import QApplication, QLabel, QLineEdit
+
 from terrygui.core.terraform_parser import TerraformVariable
+from terrygui.ui.dialogs.confirm_dialog import ConfirmDialog
+from terrygui.ui.widgets.output_viewer import OutputViewerWidget
+from terrygui.ui.widgets.variable_input import (
+    InputSanitizer,
+    VariableInputWidget,
+    VariablesPanel,
+)
+
+
+# Variables shared by tests; widgets only read them.
+_VAR_REGION = TerraformVariable(name="region", type="string", default="us-east-1")
+_VAR_API_KEY = TerraformVariable(name="api_key", type="string")
+_VAR_ENABLED = TerraformVariable(name="enabled", type="bool", default=True)
+_VAR_COUNT = TerraformVariable(name="count", type="number", default=3)
+_VAR_SECRET = TerraformVariable(name="secret", type="string", sensitive=True)
+
 
-# Guard: skip Qt-dependent tests if PySide6 is not importable
-# (CI without Qt system libs). Pure logic tests always run.
-try:
-    from PySide6.QtWidgets import QApplication
-    _HAS_QT = True
-except ImportError:
-    _HAS_QT = False
+@pytest.fixture
+def panel(qtbot):
+    """A fresh VariablesPanel; rows and signal connections carry per-test state."""
+    panel = VariablesPanel()
+    qtbot.addWidget(panel)
+    return panel
 
-needs_qt = pytest.mark.skipif(not _HAS_QT, reason="PySide6 not available")
+
+@pytest.fixture
+def output_viewer(shared_widget):
+    """The class's shared OutputViewerWidget, with its output and search box cleared."""
+    viewer = shared_widget(OutputViewerWidget)
+    viewer.clear()
+    viewer._search_input.clear()
+    return viewer
 
 
 # ---------------------------------------------------------------------------
@@ -27,62 +56,91 @@ needs_qt = pytest.mark.skipif(not _HAS_QT, reason="PySide6 not available")
 class TestVariableInputWidget:
     """Tests that exercise VariableInputWidget logic via its public API."""
 
-    @needs_qt
     def test_string_variable_default(self, qtbot):
-        from terrygui.ui.widgets.variable_input import VariableInputWidget
-        var = TerraformVariable(name="region", type="string", default="us-east-1")
-        widget = VariableInputWidget(var)
+        widget = VariableInputWidget(_VAR_REGION)
         qtbot.addWidget(widget)
         assert widget.get_value() == "us-east-1"
         assert widget.is_valid()
 
-    @needs_qt
     def test_required_variable_empty_invalid(self, qtbot):
-        from terrygui.ui.widgets.variable_input import VariableInputWidget
-        var = TerraformVariable(name="api_key", type="string")  # no default → required
-        widget = VariableInputWidget(var)
+        widget = VariableInputWidget(_VAR_API_KEY)  # no default → required
         qtbot.addWidget(widget)
         assert not widget.is_valid()
 
-    @needs_qt
     def test_bool_variable(self, qtbot):
-        from terrygui.ui.widgets.variable_input import VariableInputWidget
-        var = TerraformVariable(name="enabled", type="bool", default=True)
-        widget = VariableInputWidget(var)
+        widget = VariableInputWidget(_VAR_ENABLED)
         qtbot.addWidget(widget)
         assert widget.get_value() is True
         widget.set_value(False)
         assert widget.get_value() is False
 
-    @needs_qt
     def test_number_variable(self, qtbot):
-        from terrygui.ui.widgets.variable_input import VariableInputWidget
-        var = TerraformVariable(name="count", type="number", default=3)
-        widget = VariableInputWidget(var)
+        widget = VariableInputWidget(_VAR_COUNT)
         qtbot.addWidget(widget)
         assert widget.get_value() == "3"
 
-    @needs_qt
-    def test_sensitive_variable_has_password_mode(self, qtbot):
-        from terrygui.ui.widgets.variable_input import VariableInputWidget
-        from PySide6.QtWidgets import QLineEdit
-        var = TerraformVariable(name="secret", type="string", sensitive=True)
+    def test_typing_validates_after_pause(self, qtbot):
+        widget = VariableInputWidget(_VAR_COUNT)
+        qtbot.addWidget(widget)
+
+        changed = []
+        widget.value_changed.connect(changed.append)
+        widget._input.clear()
+        qtbot.keyClicks(widget._input, "abc")
+
+        # Every keystroke is reported, but validation waits for the pause
+        assert changed == ["count"] * 4
+        assert widget.validation_label.text() == ""
+        qtbot.waitUntil(lambda: widget.validation_label.text() == "!")
+
+    def test_is_valid_reuses_last_validation(self, qtbot):
+        var = TerraformVariable(name="tags", type="list", default=["a"])
         widget = VariableInputWidget(var)
         qtbot.addWidget(widget)
+
+        with patch.object(InputSanitizer, "sanitize_variable_value",
+                          wraps=InputSanitizer.sanitize_variable_value) as sanitize:
+            assert widget.is_valid()
+            assert widget.is_valid()
+            assert sanitize.call_count == 0
+
+            widget.set_value('["a", "b"]')
+            assert widget.is_valid()
+            assert sanitize.call_count == 1
+
+    def test_whitespace_only_edit_not_reported(self, qtbot):
+        var = TerraformVariable(name="region", type="string", default="us")
+        widget = VariableInputWidget(var)
+        qtbot.addWidget(widget)
+
+        changed = []
+        widget.value_changed.connect(changed.append)
+        qtbot.keyClicks(widget._input, " ")
+        assert changed == []
+        qtbot.keyClicks(widget._input, "x")
+        assert changed == ["region"]
+
+    def test_sensitive_variable_has_password_mode(self, qtbot):
+        widget = VariableInputWidget(_VAR_SECRET)
+        qtbot.addWidget(widget)
         assert widget._input.echoMode() == QLineEdit.EchoMode.Password
 
-    @needs_qt
+    def test_sensitive_non_string_variable_uses_text_input(self, qtbot):
+        var = TerraformVariable(name="tls", type="bool", default=True, sensitive=True)
+        widget = VariableInputWidget(var)
+        qtbot.addWidget(widget)
+        assert isinstance(widget._input, QLineEdit)
+        widget.set_value("false")
+        assert widget.get_value() == "false"
+
     def test_set_value_string(self, qtbot):
-        from terrygui.ui.widgets.variable_input import VariableInputWidget
         var = TerraformVariable(name="name", type="string")
         widget = VariableInputWidget(var)
         qtbot.addWidget(widget)
         widget.set_value("hello")
         assert widget.get_value() == "hello"
 
-    @needs_qt
     def test_list_variable(self, qtbot):
-        from terrygui.ui.widgets.variable_input import VariableInputWidget
         var = TerraformVariable(name="tags", type="list", default=["a", "b"])
         widget = VariableInputWidget(var)
         qtbot.addWidget(widget)
@@ -96,53 +154,127 @@ class TestVariableInputWidget:
 # ---------------------------------------------------------------------------
 
 class TestVariablesPanel:
-    @needs_qt
-    def test_load_variables(self, qtbot):
-        from terrygui.ui.widgets.variable_input import VariablesPanel
-        panel = VariablesPanel()
-        qtbot.addWidget(panel)
-
+    def test_load_variables(self, panel):
         variables = [
-            TerraformVariable(name="region", type="string", default="us-east-1"),
-            TerraformVariable(name="enabled", type="bool", default=True),
+            _VAR_REGION,
+            _VAR_ENABLED,
         ]
         panel.load_variables(variables)
         assert len(panel._widgets) == 2
         assert panel.all_valid()
 
-    @needs_qt
-    def test_load_with_saved_values(self, qtbot):
-        from terrygui.ui.widgets.variable_input import VariablesPanel
-        panel = VariablesPanel()
-        qtbot.addWidget(panel)
-
+    def test_load_with_saved_values(self, panel):
         variables = [
-            TerraformVariable(name="region", type="string", default="us-east-1"),
+            _VAR_REGION,
         ]
         panel.load_variables(variables, saved_values={"region": "eu-west-1"})
         assert panel._widgets["region"].get_value() == "eu-west-1"
 
-    @needs_qt
-    def test_clear(self, qtbot):
-        from terrygui.ui.widgets.variable_input import VariablesPanel
+    def test_load_emits_single_values_loaded(self, panel):
+        loaded = []
+        panel.values_loaded.connect(lambda: loaded.append(True))
+        variables = [
+            TerraformVariable(name="a", type="string"),
+            TerraformVariable(name="b", type="number"),
+        ]
+        panel.load_variables(variables, saved_values={"a": "x", "b": "abc"})
+
+        assert loaded == [True]
+        # Validation still runs for restored values
+        assert panel._widgets["b"].validation_label.text() == "!"
+
+    def test_reload_reuses_rows_with_same_name_and_type(self, panel):
+        panel.load_variables([
+            _VAR_REGION,
+            TerraformVariable(name="count", type="number"),
+            TerraformVariable(name="gone", type="string"),
+        ])
+        region, count = panel._widgets["region"], panel._widgets["count"]
+        region.set_value("edited")
+
+        panel.load_variables([
+            TerraformVariable(name="count", type="string"),
+            TerraformVariable(name="region", type="string", default="eu-west-1",
+                              description="Deploy region"),
+        ])
+
+        assert panel._widgets["region"] is region
+        assert panel._widgets["count"] is not count  # type changed
+        assert "gone" not in panel._widgets
+        # Re-bound rows show the new variable, reset to its default
+        assert region.get_value() == "eu-west-1"
+        assert "Deploy region" in region.name_label.toolTip()
+        assert panel.get_all_values() == {"region": "eu-west-1"}
+        # Rows follow the new declaration order
+        assert panel._container_layout.indexOf(panel._widgets["count"]) < \
+            panel._container_layout.indexOf(region)
+
+    def test_rows_built_in_batches(self, qtbot, monkeypatch):
+        monkeypatch.setattr(VariablesPanel, "ROW_BATCH", 2)
         panel = VariablesPanel()
         qtbot.addWidget(panel)
 
+        panel.load_variables([
+            TerraformVariable(name="a", type="string", default="x"),
+            TerraformVariable(name="b", type="bool", default=True),
+            TerraformVariable(name="c", type="list", default=["p"]),
+            TerraformVariable(name="d", type="number"),
+        ], saved_values={"d": "abc"})
+
+        assert list(panel._widgets) == ["a", "b"]
+        # Unbuilt rows still count towards values and validation
+        assert panel.get_all_values() == {
+            "a": "x", "b": True, "c": '[\n  "p"\n]', "d": "abc",
+        }
+        assert not panel.all_valid()
+        assert panel.set_values({"d": "3"}) == 1
+        assert panel.all_valid()
+
+        panel._on_scrolled()
+        assert list(panel._widgets) == ["a", "b", "c", "d"]
+        assert panel._widgets["d"].get_value() == "3"
+        assert panel.get_all_values()["c"] == '[\n  "p"\n]'
+
+    def test_duplicate_name_keeps_last_declaration(self, panel):
+        panel.load_variables([
+            TerraformVariable(name="a", type="string", default="first"),
+            TerraformVariable(name="b", type="string", default="b"),
+            TerraformVariable(name="a", type="number", default=2),
+        ])
+
+        assert list(panel._widgets) == ["a", "b"]
+        assert panel.get_var_types() == {"a": "number", "b": "string"}
+        assert panel.get_all_values() == {"a": "2", "b": "b"}
+        assert panel._container_layout.count() == 4  # placeholder, 2 rows, stretch
+
+    def test_values_track_edits(self, panel):
+        variables = [
+            _VAR_REGION,
+            TerraformVariable(name="name", type="string"),
+        ]
+        panel.load_variables(variables)
+        assert panel.get_all_values() == {"region": "us-east-1"}
+
+        panel._widgets["name"].set_value("web")
+        panel._widgets["region"].set_value("")
+        assert panel.get_all_values() == {"name": "web"}
+
+        var_types = panel.get_var_types()
+        assert var_types["region"] == "string"
+        with pytest.raises(TypeError):
+            var_types["region"] = "number"
+
+    def test_clear(self, panel):
         variables = [TerraformVariable(name="x", type="string", default="val")]
         panel.load_variables(variables)
         assert len(panel._widgets) == 1
         panel.clear()
         assert len(panel._widgets) == 0
 
-    @needs_qt
-    def test_get_non_sensitive_values(self, qtbot):
-        from terrygui.ui.widgets.variable_input import VariablesPanel
-        panel = VariablesPanel()
-        qtbot.addWidget(panel)
-
+    def test_get_non_sensitive_values(self, panel):
         variables = [
-            TerraformVariable(name="region", type="string", default="us-east-1"),
-            TerraformVariable(name="secret", type="string", sensitive=True),
+            _VAR_REGION,
+            _VAR_SECRET,
         ]
         panel.load_variables(variables)
         panel._widgets["secret"].set_value("my_secret")
@@ -157,111 +289,137 @@ class TestVariablesPanel:
 # ---------------------------------------------------------------------------
 
 class TestOutputViewerWidget:
-    @needs_qt
-    def test_append_output(self, qtbot):
-        from terrygui.ui.widgets.output_viewer import OutputViewerWidget
+    def test_append_output(self, output_viewer):
+        output_viewer.append_output("Hello world")
+        assert "Hello world" in output_viewer.get_text()
+        assert output_viewer.line_count() == 1
+
+    def test_append_multiple_lines(self, output_viewer):
+        output_viewer.append_output("line 1")
+        output_viewer.append_output("line 2")
+        output_viewer.append_output("line 3")
+        assert output_viewer.line_count() == 3
+
+    def test_append_multiline_chunk(self, output_viewer):
+        output_viewer.append_output("line 1\nline 2")
+        output_viewer.append_output("line 3")
+        assert output_viewer.line_count() == 3
+        assert output_viewer.get_text() == "line 1\nline 2\nline 3"
+
+    def test_appends_are_flushed_together(self, qtbot, output_viewer):
+        output_viewer.append_output("one")
+        output_viewer.append_output("two")
+        # Nothing is written until the flush timer fires
+        assert output_viewer._text_edit.toPlainText() == ""
+        qtbot.waitUntil(lambda: output_viewer._text_edit.toPlainText() == "one\ntwo")
+
+    def test_copy_puts_all_output_on_clipboard(self, output_viewer):
+        output_viewer.append_output("\x1b[32mline 1\x1b[0m")
+        output_viewer.append_output("line 2")
+
+        output_viewer._on_copy()
+
+        assert QApplication.clipboard().text() == "line 1\nline 2"
+        assert not output_viewer._text_edit.textCursor().hasSelection()
+
+    def test_search_finds_literal_text_and_wraps(self, output_viewer):
+        output_viewer.append_output("aws_instance.web (1)")
+        output_viewer.append_output("AWS_INSTANCE.web (1)")
+
+        output_viewer._search_input.setText("instance.web (1)")
+        output_viewer._on_search()
+        first = output_viewer._text_edit.textCursor().selectionStart()
+        output_viewer._on_search()
+        second = output_viewer._text_edit.textCursor().selectionStart()
+        output_viewer._on_search()  # wraps back to the first match
+
+        assert first == 4
+        assert second > first
+        assert output_viewer._text_edit.textCursor().selectionStart() == first
+
+    def test_clear(self, output_viewer):
+        output_viewer.append_output("something")
+        output_viewer.clear()
+        assert output_viewer.get_text() == ""
+        assert output_viewer.line_count() == 0
+
+    def test_max_lines_enforced(self, qtbot, monkeypatch):
+        monkeypatch.setattr(OutputViewerWidget, "MAX_LINES", 5)  # Override for test speed
         viewer = OutputViewerWidget()
         qtbot.addWidget(viewer)
-        viewer.append_output("Hello world")
-        assert "Hello world" in viewer.get_text()
-        assert viewer.line_count() == 1
-
-    @needs_qt
-    def test_append_multiple_lines(self, qtbot):
-        from terrygui.ui.widgets.output_viewer import OutputViewerWidget
-        viewer = OutputViewerWidget()
-        qtbot.addWidget(viewer)
-        viewer.append_output("line 1")
-        viewer.append_output("line 2")
-        viewer.append_output("line 3")
-        assert viewer.line_count() == 3
-
-    @needs_qt
-    def test_clear(self, qtbot):
-        from terrygui.ui.widgets.output_viewer import OutputViewerWidget
-        viewer = OutputViewerWidget()
-        qtbot.addWidget(viewer)
-        viewer.append_output("something")
-        viewer.clear()
-        assert viewer.get_text() == ""
-        assert viewer.line_count() == 0
-
-    @needs_qt
-    def test_max_lines_enforced(self, qtbot):
-        from terrygui.ui.widgets.output_viewer import OutputViewerWidget
-        viewer = OutputViewerWidget()
-        viewer.MAX_LINES = 5  # Override for test speed
-        qtbot.addWidget(viewer)
         for i in range(10):
             viewer.append_output(f"line {i}")
         assert viewer.line_count() == 5
+        # Oldest lines are evicted; the latest output is kept
+        assert viewer.get_text() == "\n".join(f"line {i}" for i in range(5, 10))
 
-    @needs_qt
-    def test_ansi_color_stripped_from_plain_text(self, qtbot):
-        from terrygui.ui.widgets.output_viewer import OutputViewerWidget
-        viewer = OutputViewerWidget()
-        qtbot.addWidget(viewer)
-        viewer.append_output("\x1b[32mSuccess\x1b[0m")
+        viewer.clear()
+        for i in range(7):
+            viewer.append_output(f"again {i}")
+        assert viewer.get_text().splitlines()[0] == "again 2"
+
+    def test_ansi_color_stripped_from_plain_text(self, output_viewer):
+        output_viewer.append_output("\x1b[32mSuccess\x1b[0m")
         # Plain text should not contain escape codes
-        plain = viewer.get_text()
+        plain = output_viewer.get_text()
         assert "\x1b" not in plain
         assert "Success" in plain
 
+    def test_ansi_segments_keep_their_own_format(self, output_viewer):
+        output_viewer.append_output("\x1b[1mA\x1b[31mB\x1b[0mC")
+        assert output_viewer.get_text() == "ABC"
+
+        def format_at(pos):
+            cursor = QTextCursor(output_viewer._text_edit.document())
+            cursor.setPosition(pos + 1)  # charFormat() is of the char before
+            return cursor.charFormat()
+
+        bold_a, red_b, plain_c = format_at(0), format_at(1), format_at(2)
+        assert bold_a.fontWeight() == QFont.Weight.Bold
+        assert bold_a.foreground().color().name() != "#cc0000"
+        assert red_b.foreground().color().name() == "#cc0000"
+        assert plain_c.fontWeight() != QFont.Weight.Bold
+
 
 # ---------------------------------------------------------------------------
 # ConfirmDialog tests
 # ---------------------------------------------------------------------------
 
 class TestConfirmDialog:
-    @needs_qt
     def test_apply_dialog_button_disabled_initially(self, qtbot):
-        from terrygui.ui.dialogs.confirm_dialog import ConfirmDialog
         dialog = ConfirmDialog("apply", {"workspace": "default"})
         qtbot.addWidget(dialog)
         assert not dialog._action_button.isEnabled()
 
-    @needs_qt
     def test_apply_dialog_button_enables_on_check(self, qtbot):
-        from terrygui.ui.dialogs.confirm_dialog import ConfirmDialog
-        from PySide6.QtCore import Qt
         dialog = ConfirmDialog("apply", {"workspace": "default"})
         qtbot.addWidget(dialog)
         dialog._ack_checkbox.setCheckState(Qt.CheckState.Checked)
         assert dialog._action_button.isEnabled()
 
-    @needs_qt
     def test_apply_dialog_button_text(self, qtbot):
-        from terrygui.ui.dialogs.confirm_dialog import ConfirmDialog
         dialog = ConfirmDialog("apply")
         qtbot.addWidget(dialog)
         assert dialog._action_button.text() == "Continue"
 
-    @needs_qt
     def test_destroy_dialog_button_text(self, qtbot):
-        from terrygui.ui.dialogs.confirm_dialog import ConfirmDialog
         dialog = ConfirmDialog("destroy")
         qtbot.addWidget(dialog)
         assert dialog._action_button.text() == "Destroy"
 
-    @needs_qt
     def test_destroy_dialog_shows_workspace(self, qtbot):
-        from terrygui.ui.dialogs.confirm_dialog import ConfirmDialog
         dialog = ConfirmDialog("destroy", {"workspace": "production"})
         qtbot.addWidget(dialog)
         # The workspace should appear somewhere in the dialog
         # Check by looking at all labels
         found = False
-        from PySide6.QtWidgets import QLabel
         for label in dialog.findChildren(QLabel):
             if "production" in label.text():
                 found = True
                 break
         assert found
 
-    @needs_qt
     def test_checkbox_uncheck_disables_button(self, qtbot):
-        from terrygui.ui.dialogs.confirm_dialog import ConfirmDialog
-        from PySide6.QtCore import Qt
         dialog = ConfirmDialog("apply")
         qtbot.addWidget(dialog)
         dialog._ack_checkbox.setCheckState(Qt.CheckState.Checked)
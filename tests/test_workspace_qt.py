@@ -0,0 +1,157 @@
+"""Tests for Phase 4 workspace widgets (WorkspaceDialog, WorkspacePanelWidget).
+
+Skipped when PySide6 (or its Qt system libraries) cannot be imported.
+"""
+
+from dataclasses import dataclass, field
+from typing import List
+from unittest.mock import patch
+
+import pytest
+
+pytest.importorskip("PySide6.QtWidgets", reason="PySide6 not available")
+
+from terrygui.core.workspace_manager import WorkspaceInfo
+from terrygui.ui.dialogs.workspace_dialog import WorkspaceDialog
+from terrygui.ui.widgets.workspace_panel import WorkspacePanelWidget
+
+
+@pytest.fixture
+def panel(qtbot):
+    """A fresh WorkspacePanelWidget with no manager set."""
+    panel = WorkspacePanelWidget()
+    qtbot.addWidget(panel)
+    return panel
+
+
+# ---------------------------------------------------------------------------
+# WorkspaceDialog tests (Qt)
+# ---------------------------------------------------------------------------
+
+class TestWorkspaceDialog:
+    """Tests for the workspace create/delete dialogs."""
+
+    def test_create_dialog_starts_with_disabled_button(self, qtbot):
+        dialog = WorkspaceDialog("create")
+        qtbot.addWidget(dialog)
+
+        assert not dialog._create_button.isEnabled()
+
+    def test_create_dialog_valid_name_enables_button(self, qtbot):
+        dialog = WorkspaceDialog("create")
+        qtbot.addWidget(dialog)
+
+        dialog._name_input.setText("staging")
+        assert dialog._create_button.isEnabled()
+        assert dialog._error_label.text() == ""
+
+    def test_create_dialog_invalid_name_shows_error(self, qtbot):
+        dialog = WorkspaceDialog("create")
+        qtbot.addWidget(dialog)
+
+        dialog._name_input.setText("bad name!")
+        assert not dialog._create_button.isEnabled()
+        assert dialog._error_label.text() != ""
+
+    def test_create_dialog_workspace_name(self, qtbot):
+        dialog = WorkspaceDialog("create")
+        qtbot.addWidget(dialog)
+
+        dialog._name_input.setText("  my-workspace  ")
+        assert dialog.workspace_name() == "my-workspace"
+
+    def test_delete_dialog_shows_workspace_name(self, qtbot):
+        dialog = WorkspaceDialog("delete", workspace_name_value="staging")
+        qtbot.addWidget(dialog)
+
+        assert dialog.workspace_name() == "staging"
+
+    def test_delete_dialog_is_modal(self, qtbot):
+        dialog = WorkspaceDialog("delete", workspace_name_value="staging")
+        qtbot.addWidget(dialog)
+
+        assert dialog.isModal()
+
+
+# ---------------------------------------------------------------------------
+# WorkspacePanelWidget tests (Qt)
+# ---------------------------------------------------------------------------
+
+@dataclass
+class FakeWorkspaceManager:
+    """Just enough of a WorkspaceManager for the panel: a list and recorded switches."""
+    workspaces: List[WorkspaceInfo]
+    switched: List[str] = field(default_factory=list)
+
+    def list_workspaces(self):
+        return list(self.workspaces)
+
+    def switch_workspace(self, name):
+        self.switched.append(name)
+        return True
+
+
+class TestWorkspacePanelWidget:
+    """Tests for the workspace selector panel."""
+
+    def test_starts_disabled(self, panel):
+        assert not panel.isEnabled()
+
+    def test_set_manager_enables_and_populates(self, panel):
+        mgr = FakeWorkspaceManager([
+            WorkspaceInfo("default", True),
+            WorkspaceInfo("staging", False),
+        ])
+
+        panel.set_manager(mgr)
+
+        assert panel.isEnabled()
+        assert panel._combo.count() == 2
+        assert panel._combo.currentText() == "default"
+
+    def test_current_workspace_default(self, panel):
+        assert panel.current_workspace() == "default"
+
+    def test_delete_disabled_for_default(self, panel):
+        mgr = FakeWorkspaceManager([
+            WorkspaceInfo("default", True),
+        ])
+
+        panel.set_manager(mgr)
+        assert not panel._delete_button.isEnabled()
+
+    def test_refresh_updates_combo(self, panel):
+        mgr = FakeWorkspaceManager([
+            WorkspaceInfo("default", True),
+        ])
+        panel.set_manager(mgr)
+        assert panel._combo.count() == 1
+
+        # Simulate workspaces changing
+        mgr.workspaces = [
+            WorkspaceInfo("default", False),
+            WorkspaceInfo("staging", True),
+            WorkspaceInfo("prod", False),
+        ]
+        panel.refresh()
+        assert panel._combo.count() == 3
+        assert panel._combo.currentText() == "staging"
+
+    def test_refresh_with_same_workspaces_keeps_items(self, panel):
+        mgr = FakeWorkspaceManager([
+            WorkspaceInfo("default", True),
+            WorkspaceInfo("staging", False),
+        ])
+        panel.set_manager(mgr)
+
+        # Same names, different current workspace: only the selection moves
+        mgr.workspaces = [
+            WorkspaceInfo("default", False),
+            WorkspaceInfo("staging", True),
+        ]
+        with patch.object(panel._combo, "clear") as clear:
+            panel.refresh()
+
+        clear.assert_not_called()
+        assert panel._combo.currentText() == "staging"
+        assert mgr.switched == []